@@ -7,16 +7,26 @@ BOGUN2018 프로시저 매핑 추출기
 import os
 import re
 import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
 from openpyxl.utils import get_column_letter
 
+# Aho-Corasick 다중 키워드 매칭 (선택 설치: pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcedureCall:
     """프로시저 호출 정보"""
     procedure_name: str
@@ -26,7 +36,7 @@ class ProcedureCall:
     form_name: str = ""  # 추론된 폼 이름
 
 
-@dataclass
+@dataclass(slots=True)
 class FormSummary:
     """폼별 요약 정보"""
     form_name: str
@@ -34,7 +44,7 @@ class FormSummary:
     procedures: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcedureSummary:
     """프로시저별 요약 정보"""
     procedure_name: str
@@ -149,6 +159,24 @@ PROC_NAME_PATTERNS = [
     (r"Code(?!Material)|DHCode|MethodCode", "90. 공통/코드관리"),
 ]
 
+# PROC_NAME_PATTERNS 전체를 하나의 정규식으로 결합
+# 각 패턴을 문자열 시작 위치의 lookahead 분기로 감싸서 "목록상 먼저 나온 패턴 우선" 규칙을 유지
+# (단순 alternation + search는 문자열에서 가장 왼쪽 매칭을 반환하므로 우선순위가 달라짐)
+# 패턴은 미리 소문자로 바꿔 두고 IGNORECASE 없이 컴파일 (대소문자 무시는 이름을 소문자화해서 처리)
+PROC_NAME_RE = re.compile(
+    '|'.join(f'(?=.*?(?P<g{i}>{pattern.lower()}))' for i, (pattern, _) in enumerate(PROC_NAME_PATTERNS))
+)
+PROC_NAME_MENUS = [menu_key for _, menu_key in PROC_NAME_PATTERNS]
+
+
+def _match_proc_name_menu(proc_name: str) -> Optional[str]:
+    """프로시저 이름 패턴으로 메뉴 조회 (매칭 없으면 None)"""
+    match = PROC_NAME_RE.match(proc_name.lower())
+    if match:
+        return PROC_NAME_MENUS[match.lastindex - 1]
+    return None
+
+
 # 메뉴 구조 (001.png + 002.png 기반)
 MENU_STRUCTURE = {
     "1. 메인 > 보건관리": {
@@ -293,6 +321,209 @@ MENU_STRUCTURE = {
 }
 
 
+# 폼 이름 → 메뉴 (역순으로 채워서 MENU_STRUCTURE 순서상 먼저 등장한 메뉴가 우선)
+FORM_TO_MENU = {
+    form: menu_key
+    for menu_key, menu_info in reversed(MENU_STRUCTURE.items())
+    for form in menu_info["forms"]
+}
+
+
+def _build_keyword_to_menu() -> Dict[str, str]:
+    """소문자 키워드 → 메뉴 (MENU_STRUCTURE 순서 유지, 중복 키워드는 먼저 등장한 메뉴 우선)"""
+    keyword_to_menu = {}
+    for menu_key, menu_info in MENU_STRUCTURE.items():
+        for keyword in menu_info["keywords"]:
+            keyword_to_menu.setdefault(keyword.lower(), menu_key)
+    return keyword_to_menu
+
+
+KEYWORD_TO_MENU = _build_keyword_to_menu()
+
+
+def _build_keyword_automaton():
+    """KEYWORD_TO_MENU 전체 키워드로 Aho-Corasick 오토마톤 생성 (pyahocorasick 없으면 None)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    # 값에 키워드 순번을 함께 저장 → 여러 키워드가 매칭되면 순번이 가장 작은 메뉴 선택
+    for priority, (keyword, menu_key) in enumerate(KEYWORD_TO_MENU.items()):
+        automaton.add_word(keyword, (priority, menu_key))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _match_keyword_menu(name: str) -> Optional[str]:
+    """이름에 포함된 메뉴 키워드로 메뉴 조회 (매칭 없으면 None)"""
+    lowered = name.lower()
+    if KEYWORD_AUTOMATON is not None:
+        # 1회 스캔으로 모든 키워드 매칭 (iter는 위치순이므로 우선순위는 min으로 결정)
+        best = min((value for _, value in KEYWORD_AUTOMATON.iter(lowered)), default=None)
+        return best[1] if best else None
+
+    for keyword, menu_key in KEYWORD_TO_MENU.items():
+        if keyword in lowered:
+            return menu_key
+    return None
+
+
+# 정규식 패턴 (워커 프로세스에서도 재사용되도록 모듈 레벨에서 컴파일)
+# 파일을 디코딩하지 않고 bytes 그대로 검색 (\x80-\xff: UTF-8 멀티바이트 문자도 이름으로 허용)
+PROC_PATTERN = re.compile(rb'["\']UP_NBOGUN_([\w\x80-\xff]+)["\']')
+# 호출 패턴 (튜플 순서가 우선순위) → 단일 정규식으로 한 번에 검사
+CALL_PATTERN_NAMES = ('DataTable', 'DataSet', 'DataReader', 'ExecuteNonQuery', 'ExecuteScalar')
+CALL_PATTERN = re.compile(rb'\.(' + '|'.join(CALL_PATTERN_NAMES).encode('ascii') + rb')\s*\(')
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# 폴더 토큰 → 폼 이름 접두어 (순서대로 검사, 경로 문자열에 포함되면 매칭)
+FOLDER_LABELS = (
+    ("Sub", "Sub"),
+    ("ModalPopup", "ModalPopup"),
+    ("Classes", "Classes"),
+    ("CostomControl", "CustomControl"),
+)
+
+# 파일 스캔 병렬 처리 시 워커 1회 전달 단위 (IPC 비용 분산)
+SCAN_CHUNKSIZE = 32
+
+# CSV 쓰기 버퍼 크기 (1MB)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Excel 이름 있는 스타일 (save_excel에서 워크북에 등록)
+HEADER_STYLE = "header"
+BORDERED_STYLE = "bordered"
+
+
+def _display_width(text: str) -> int:
+    """표시 너비 계산 (ASCII 1, 그 외(한글 등) 2)"""
+    if text.isascii():
+        return len(text)
+    # 비ASCII 문자 수 = 전체 길이 - ASCII 인코딩 시 남는 길이 (문자별 ord() 루프 대신 C 레벨 처리)
+    return 2 * len(text) - len(text.encode('ascii', 'ignore'))
+
+
+def _detect_call_pattern(line: bytes) -> str:
+    """호출 패턴 감지"""
+    found = [name.decode('ascii') for name in CALL_PATTERN.findall(line)]
+    if not found:
+        return "Unknown"
+    if len(found) == 1:
+        return found[0]
+    # 한 줄에 여러 패턴이 있으면 우선순위가 가장 높은 패턴
+    return min(found, key=CALL_PATTERN_NAMES.index)
+
+
+@lru_cache(maxsize=None)
+def _folder_rank(parent: str) -> int:
+    """상위 경로에 포함된 첫 폴더 토큰의 순번 (없으면 len(FOLDER_LABELS))"""
+    for rank, (token, _) in enumerate(FOLDER_LABELS):
+        if token in parent:
+            return rank
+    return len(FOLDER_LABELS)
+
+
+def _infer_form_name(file_path: Path) -> str:
+    """파일 경로에서 폼 이름 추론"""
+    filename = file_path.name
+    stem = filename[:-3]  # .cs 제거
+
+    # frm*.cs 파일 → 직접 매핑, UC_*.cs (커스텀 컨트롤) → 컨트롤 이름
+    if filename.endswith(".cs") and filename.startswith(("frm", "UC_")):
+        return stem
+
+    # Biz*.cs 파일 → 매핑 테이블 사용
+    form_name = BIZ_TO_FORM_MAPPING.get(filename)
+    if form_name:
+        return form_name
+
+    # Biz.cs (메인 비즈니스 클래스) → Common
+    if filename == "Biz.cs":
+        return "Common(Biz.cs)"
+
+    # Sub / ModalPopup / Classes / CostomControl 폴더 내 파일
+    # 폴더 판정은 디렉토리별로 캐시하고, 파일명은 더 높은 우선순위 토큰만 추가 검사
+    rank = _folder_rank(str(file_path.parent))
+    for token, label in FOLDER_LABELS[:rank]:
+        if token in filename:
+            return f"{label}/{stem}"
+    if rank < len(FOLDER_LABELS):
+        return f"{FOLDER_LABELS[rank][1]}/{stem}"
+
+    return f"Other/{stem}"
+
+
+def _iter_cs_files(root: str):
+    """root 이하 모든 .cs 파일 경로 (os.scandir 기반, Path.rglob("*.cs")와 같은 순서)"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".cs"):
+                    yield entry.path
+        # 하위 디렉토리는 scandir 순서대로 깊이 우선 탐색
+        stack.extend(reversed(subdirs))
+
+
+def _scan_file(path: str, base: str) -> List[ProcedureCall]:
+    """단일 파일에서 프로시저 호출 추출 (프로세스 풀 워커용)
+
+    Args:
+        path: .cs 파일 경로
+        base: 상대 경로 계산 기준 디렉토리
+
+    Returns:
+        파일 내 ProcedureCall 리스트 (라인 순서)
+    """
+    file_path = Path(path)
+    try:
+        # bytes로 읽고 UTF-8 BOM만 제거 (전체 디코딩 생략)
+        data = file_path.read_bytes()
+        if data.startswith(UTF8_BOM):
+            data = data[len(UTF8_BOM):]
+    except Exception as e:
+        print(f"파일 읽기 오류: {file_path} - {e}")
+        return []
+
+    # 파일 단위로 고정된 값은 매칭마다 계산하지 않도록 미리 계산
+    form_name = _infer_form_name(file_path)
+    rel_path = str(file_path.relative_to(base))  # 상대 경로 저장
+
+    # 파일 전체에 대해 한 번만 스캔 (프로시저명은 줄을 넘지 않으므로 줄 단위 결과와 동일)
+    calls = []
+    line_num = 1
+    pos = 0
+    for match in PROC_PATTERN.finditer(data):
+        start = match.start()
+        line_num += data.count(b'\n', pos, start)
+        pos = start
+
+        # 매칭된 줄에서 호출 패턴 감지
+        line_start = data.rfind(b'\n', 0, start) + 1
+        line_end = data.find(b'\n', start)
+        line = data[line_start:line_end] if line_end != -1 else data[line_start:]
+
+        # 디코딩은 캡처된 프로시저명에만 적용
+        full_proc_name = f"UP_NBOGUN_{match.group(1).decode('utf-8', errors='ignore')}"
+        call_pattern = _detect_call_pattern(line)
+
+        calls.append(ProcedureCall(
+            procedure_name=full_proc_name,
+            file_path=rel_path,
+            line_number=line_num,
+            call_pattern=call_pattern,
+            form_name=form_name
+        ))
+    return calls
+
+
 class BogunProcedureExtractor:
     """BOGUN2018 프로시저 추출기"""
 
@@ -301,26 +532,28 @@ class BogunProcedureExtractor:
         self.procedure_calls: List[ProcedureCall] = []
         self.form_summaries: Dict[str, FormSummary] = {}
         self.procedure_summaries: Dict[str, ProcedureSummary] = {}
-
-        # 정규식 패턴
-        self.proc_pattern = re.compile(r'["\']UP_NBOGUN_(\w+)["\']')
-        self.call_patterns = {
-            'DataTable': re.compile(r'\.DataTable\s*\('),
-            'DataSet': re.compile(r'\.DataSet\s*\('),
-            'DataReader': re.compile(r'\.DataReader\s*\('),
-            'ExecuteNonQuery': re.compile(r'\.ExecuteNonQuery\s*\('),
-            'ExecuteScalar': re.compile(r'\.ExecuteScalar\s*\('),
-        }
+        self._menu_summary: Optional[Dict[str, Dict]] = None  # _build_summaries에서 함께 집계
 
     def extract_all(self):
-        """모든 .cs 파일에서 프로시저 추출"""
+        """모든 .cs 파일에서 프로시저 추출 (프로세스 풀 병렬 스캔)"""
         print(f"스캔 시작: {self.bogun_path}")
 
-        cs_files = list(self.bogun_path.rglob("*.cs"))
+        # 워커 전달 시 pickling 비용을 줄이기 위해 str 경로 사용
+        cs_files = list(_iter_cs_files(str(self.bogun_path)))
         print(f"발견된 C# 파일: {len(cs_files)}개")
 
-        for cs_file in cs_files:
-            self._extract_from_file(cs_file)
+        scan = partial(_scan_file, base=str(self.bogun_path.parent))
+        with ProcessPoolExecutor() as executor:
+            # map은 입력 순서를 유지하므로 결과 순서가 직렬 처리와 동일
+            for calls in executor.map(scan, cs_files, chunksize=SCAN_CHUNKSIZE):
+                # 워커에서 넘어온 문자열은 매번 새 객체이므로 부모 프로세스에서 intern하여 공유
+                # (요약 dict 키/정렬 비교가 같은 객체를 사용)
+                for call in calls:
+                    call.procedure_name = sys.intern(call.procedure_name)
+                    call.form_name = sys.intern(call.form_name)
+                    call.file_path = sys.intern(call.file_path)
+                    call.call_pattern = sys.intern(call.call_pattern)
+                self.procedure_calls.extend(calls)
 
         print(f"추출 완료: {len(self.procedure_calls)}건")
         print(f"고유 프로시저: {len(self._get_unique_procedures())}개")
@@ -328,202 +561,114 @@ class BogunProcedureExtractor:
         # 요약 정보 생성
         self._build_summaries()
 
-    def _extract_from_file(self, file_path: Path):
-        """단일 파일에서 프로시저 추출"""
-        try:
-            # UTF-8 BOM 처리
-            with open(file_path, 'r', encoding='utf-8-sig', errors='ignore') as f:
-                lines = f.readlines()
-        except Exception as e:
-            print(f"파일 읽기 오류: {file_path} - {e}")
-            return
-
-        for line_num, line in enumerate(lines, 1):
-            matches = self.proc_pattern.findall(line)
-            if matches:
-                for proc_name in matches:
-                    full_proc_name = f"UP_NBOGUN_{proc_name}"
-                    call_pattern = self._detect_call_pattern(line)
-                    form_name = self._infer_form_name(file_path)
-
-                    # 상대 경로 저장
-                    rel_path = str(file_path.relative_to(self.bogun_path.parent))
-
-                    self.procedure_calls.append(ProcedureCall(
-                        procedure_name=full_proc_name,
-                        file_path=rel_path,
-                        line_number=line_num,
-                        call_pattern=call_pattern,
-                        form_name=form_name
-                    ))
-
-    def _detect_call_pattern(self, line: str) -> str:
-        """호출 패턴 감지"""
-        for pattern_name, pattern in self.call_patterns.items():
-            if pattern.search(line):
-                return pattern_name
-        return "Unknown"
-
-    def _infer_form_name(self, file_path: Path) -> str:
-        """파일 경로에서 폼 이름 추론"""
-        filename = file_path.name
-
-        # frm*.cs 파일 → 직접 매핑
-        if filename.startswith("frm") and filename.endswith(".cs"):
-            return filename[:-3]  # .cs 제거
-
-        # Biz*.cs 파일 → 매핑 테이블 사용
-        if filename in BIZ_TO_FORM_MAPPING:
-            return BIZ_TO_FORM_MAPPING[filename]
-
-        # Biz.cs (메인 비즈니스 클래스) → Common
-        if filename == "Biz.cs":
-            return "Common(Biz.cs)"
-
-        # UC_*.cs (커스텀 컨트롤) → 컨트롤 이름
-        if filename.startswith("UC_") and filename.endswith(".cs"):
-            return filename[:-3]
-
-        # Sub 폴더 내 파일
-        if "Sub" in str(file_path):
-            return f"Sub/{filename[:-3]}"
-
-        # ModalPopup 폴더 내 파일
-        if "ModalPopup" in str(file_path):
-            return f"ModalPopup/{filename[:-3]}"
-
-        # Classes 폴더
-        if "Classes" in str(file_path):
-            return f"Classes/{filename[:-3]}"
-
-        # CostomControl 폴더
-        if "CostomControl" in str(file_path):
-            return f"CustomControl/{filename[:-3]}"
-
-        return f"Other/{filename[:-3]}"
-
     def _get_unique_procedures(self) -> Set[str]:
         """고유 프로시저 목록"""
         return set(call.procedure_name for call in self.procedure_calls)
 
     def _build_summaries(self):
-        """요약 정보 생성"""
-        # 폼별 요약
-        form_procs = defaultdict(set)
+        """요약 정보 생성 (호출 목록 1회 순회로 폼별/프로시저별/메뉴별 집계)"""
+        form_procs = {}
+        proc_forms = {}
+        call_counts = Counter()
+        menu_procs = {}
+        menu_forms = {}
+        menu_counts = Counter()
         for call in self.procedure_calls:
-            form_procs[call.form_name].add(call.procedure_name)
+            form_procs.setdefault(call.form_name, set()).add(call.procedure_name)
+            proc_forms.setdefault(call.procedure_name, set()).add(call.form_name)
+            call_counts[call.procedure_name] += 1
+
+            menu = self._classify_by_menu(call.form_name, call.procedure_name)
+            menu_procs.setdefault(menu, set()).add(call.procedure_name)
+            menu_forms.setdefault(menu, set()).add(call.form_name)
+            menu_counts[menu] += 1
 
+        # 폼별 요약
         for form_name, procs in form_procs.items():
             self.form_summaries[form_name] = FormSummary(
                 form_name=form_name,
                 procedure_count=len(procs),
-                procedures=sorted(list(procs))
+                procedures=sorted(procs)
             )
 
         # 프로시저별 요약
-        proc_forms = defaultdict(set)
-        for call in self.procedure_calls:
-            proc_forms[call.procedure_name].add(call.form_name)
-
         for proc_name, forms in proc_forms.items():
-            # 호출 횟수 계산
-            call_count = sum(1 for c in self.procedure_calls if c.procedure_name == proc_name)
             self.procedure_summaries[proc_name] = ProcedureSummary(
                 procedure_name=proc_name,
-                call_count=call_count,
-                calling_forms=sorted(list(forms))
+                call_count=call_counts[proc_name],
+                calling_forms=sorted(forms)
             )
 
-    def _classify_by_menu(self, form_name: str, proc_name: str) -> str:
-        """폼/프로시저를 메뉴 구조에 따라 분류"""
+        # 메뉴별 요약 (메뉴명 순)
+        self._menu_summary = {
+            menu: {
+                "procedures": sorted(procs),
+                "procedure_count": len(procs),
+                "forms": sorted(menu_forms[menu]),
+                "call_count": menu_counts[menu]
+            }
+            for menu, procs in sorted(menu_procs.items())
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _classify_by_menu(form_name: str, proc_name: str) -> str:
+        """폼/프로시저를 메뉴 구조에 따라 분류 (동일 (폼, 프로시저) 쌍은 캐시)"""
         # 0. 공통모듈(Biz.cs)에서 호출된 경우 → 프로시저 이름 패턴으로 우선 분류
         if "Biz.cs" in form_name or form_name == "Common":
-            for pattern, menu_key in PROC_NAME_PATTERNS:
-                if re.search(pattern, proc_name, re.IGNORECASE):
-                    return menu_key
             # 패턴 매칭 실패 시 99. 공통모듈로 분류
-            return "99. 공통모듈"
+            return _match_proc_name_menu(proc_name) or "99. 공통모듈"
 
         # 1. 폼 이름으로 직접 매칭
-        for menu_key, menu_info in MENU_STRUCTURE.items():
-            if form_name in menu_info["forms"]:
-                return menu_key
+        if form_name in FORM_TO_MENU:
+            return FORM_TO_MENU[form_name]
 
         # 2. 폼 이름 키워드 매칭
-        for menu_key, menu_info in MENU_STRUCTURE.items():
-            for keyword in menu_info["keywords"]:
-                if keyword.lower() in form_name.lower():
-                    return menu_key
+        menu_key = _match_keyword_menu(form_name)
+        if menu_key:
+            return menu_key
 
         # 3. 프로시저 이름 패턴 매칭 (일반 폼에서 호출된 경우에도 적용)
-        for pattern, menu_key in PROC_NAME_PATTERNS:
-            if re.search(pattern, proc_name, re.IGNORECASE):
-                return menu_key
+        menu_key = _match_proc_name_menu(proc_name)
+        if menu_key:
+            return menu_key
 
         # 4. MENU_STRUCTURE 키워드 매칭 (fallback)
-        for menu_key, menu_info in MENU_STRUCTURE.items():
-            for keyword in menu_info["keywords"]:
-                if keyword.lower() in proc_name.lower():
-                    return menu_key
-
-        return "98. 미분류"
+        return _match_keyword_menu(proc_name) or "98. 미분류"
 
     def get_menu_based_summary(self) -> Dict[str, Dict]:
-        """메뉴 기반 요약 생성"""
-        menu_summary = defaultdict(lambda: {
-            "procedures": set(),
-            "forms": set(),
-            "call_count": 0
-        })
-
-        for call in self.procedure_calls:
-            menu = self._classify_by_menu(call.form_name, call.procedure_name)
-            menu_summary[menu]["procedures"].add(call.procedure_name)
-            menu_summary[menu]["forms"].add(call.form_name)
-            menu_summary[menu]["call_count"] += 1
-
-        # set을 list로 변환
-        result = {}
-        for menu, data in menu_summary.items():
-            result[menu] = {
-                "procedures": sorted(list(data["procedures"])),
-                "procedure_count": len(data["procedures"]),
-                "forms": sorted(list(data["forms"])),
-                "call_count": data["call_count"]
-            }
-
-        return dict(sorted(result.items()))
+        """메뉴 기반 요약 (_build_summaries에서 집계된 결과 재사용)"""
+        if self._menu_summary is None:
+            self._build_summaries()
+        return self._menu_summary
 
     def save_csv(self, output_path: str):
         """CSV 파일 저장"""
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
+        with open(output_file, 'w', newline='', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # 헤더
             writer.writerow(["폼명", "프로시저명", "파일경로", "라인번호", "호출패턴"])
 
-            # 데이터 (폼명으로 정렬)
+            # 데이터 (폼명으로 정렬) - writerows로 한 번에 기록
             sorted_calls = sorted(self.procedure_calls, key=lambda x: (x.form_name, x.procedure_name))
-            for call in sorted_calls:
-                writer.writerow([
-                    call.form_name,
-                    call.procedure_name,
-                    call.file_path,
-                    call.line_number,
-                    call.call_pattern
-                ])
+            writer.writerows(
+                (call.form_name, call.procedure_name, call.file_path, call.line_number, call.call_pattern)
+                for call in sorted_calls
+            )
 
         print(f"CSV 저장 완료: {output_file}")
 
     def save_excel(self, output_path: str):
-        """Excel 파일 저장 (3개 시트)"""
+        """Excel 파일 저장 (6개 시트, write-only 스트리밍 모드)"""
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        wb = Workbook()
+        # write-only 모드: 셀 그리드를 메모리에 유지하지 않고 행 단위로 바로 기록
+        wb = Workbook(write_only=True)
 
         # 스타일 정의
         header_font = Font(bold=True)
@@ -536,108 +681,75 @@ class BogunProcedureExtractor:
             bottom=Side(style='thin')
         )
 
-        # === Sheet 1: 전체 목록 ===
-        ws1 = wb.active
-        ws1.title = "전체목록"
-
-        headers1 = ["폼명", "프로시저명", "파일경로", "라인번호", "호출패턴"]
-        for col, header in enumerate(headers1, 1):
-            cell = ws1.cell(row=1, column=col, value=header)
-            cell.font = header_font_white
-            cell.fill = header_fill
-            cell.border = thin_border
+        # 셀마다 Font/Fill/Border 객체를 대입하지 않도록 이름 있는 스타일로 한 번만 등록
+        wb.add_named_style(NamedStyle(
+            name=HEADER_STYLE, font=header_font_white, fill=header_fill, border=thin_border
+        ))
+        wb.add_named_style(NamedStyle(name=BORDERED_STYLE, border=thin_border))
 
+        # === Sheet 1: 전체 목록 ===
         sorted_calls = sorted(self.procedure_calls, key=lambda x: (x.form_name, x.procedure_name))
-        for row_idx, call in enumerate(sorted_calls, 2):
-            ws1.cell(row=row_idx, column=1, value=call.form_name).border = thin_border
-            ws1.cell(row=row_idx, column=2, value=call.procedure_name).border = thin_border
-            ws1.cell(row=row_idx, column=3, value=call.file_path).border = thin_border
-            ws1.cell(row=row_idx, column=4, value=call.line_number).border = thin_border
-            ws1.cell(row=row_idx, column=5, value=call.call_pattern).border = thin_border
-
-        self._auto_adjust_width(ws1)
+        self._write_sheet(
+            wb.create_sheet(title="전체목록"),
+            ["폼명", "프로시저명", "파일경로", "라인번호", "호출패턴"],
+            [
+                [call.form_name, call.procedure_name, call.file_path, call.line_number, call.call_pattern]
+                for call in sorted_calls
+            ]
+        )
 
         # === Sheet 2: 폼별 요약 ===
-        ws2 = wb.create_sheet(title="폼별요약")
-
-        headers2 = ["폼명", "프로시저수", "프로시저목록"]
-        for col, header in enumerate(headers2, 1):
-            cell = ws2.cell(row=1, column=col, value=header)
-            cell.font = header_font_white
-            cell.fill = header_fill
-            cell.border = thin_border
-
+        rows2 = []
         sorted_forms = sorted(self.form_summaries.values(), key=lambda x: -x.procedure_count)
-        for row_idx, summary in enumerate(sorted_forms, 2):
-            ws2.cell(row=row_idx, column=1, value=summary.form_name).border = thin_border
-            ws2.cell(row=row_idx, column=2, value=summary.procedure_count).border = thin_border
+        for summary in sorted_forms:
             # 프로시저 목록 (최대 10개 표시)
             proc_list = ", ".join(summary.procedures[:10])
             if len(summary.procedures) > 10:
                 proc_list += f" ... (+{len(summary.procedures) - 10}개)"
-            ws2.cell(row=row_idx, column=3, value=proc_list).border = thin_border
+            rows2.append([summary.form_name, summary.procedure_count, proc_list])
 
-        self._auto_adjust_width(ws2)
+        self._write_sheet(
+            wb.create_sheet(title="폼별요약"),
+            ["폼명", "프로시저수", "프로시저목록"],
+            rows2
+        )
 
         # === Sheet 3: 프로시저별 요약 ===
-        ws3 = wb.create_sheet(title="프로시저별요약")
-
-        headers3 = ["프로시저명", "호출횟수", "호출폼목록"]
-        for col, header in enumerate(headers3, 1):
-            cell = ws3.cell(row=1, column=col, value=header)
-            cell.font = header_font_white
-            cell.fill = header_fill
-            cell.border = thin_border
-
         sorted_procs = sorted(self.procedure_summaries.values(), key=lambda x: -x.call_count)
-        for row_idx, summary in enumerate(sorted_procs, 2):
-            ws3.cell(row=row_idx, column=1, value=summary.procedure_name).border = thin_border
-            ws3.cell(row=row_idx, column=2, value=summary.call_count).border = thin_border
-            ws3.cell(row=row_idx, column=3, value=", ".join(summary.calling_forms)).border = thin_border
-
-        self._auto_adjust_width(ws3)
+        self._write_sheet(
+            wb.create_sheet(title="프로시저별요약"),
+            ["프로시저명", "호출횟수", "호출폼목록"],
+            [
+                [summary.procedure_name, summary.call_count, ", ".join(summary.calling_forms)]
+                for summary in sorted_procs
+            ]
+        )
 
         # === Sheet 4: 메뉴별 요약 (NEW!) ===
-        ws4 = wb.create_sheet(title="메뉴별요약")
-
         menu_summary = self.get_menu_based_summary()
 
-        headers4 = ["메뉴", "프로시저수", "호출횟수", "관련폼"]
-        for col, header in enumerate(headers4, 1):
-            cell = ws4.cell(row=1, column=col, value=header)
-            cell.font = header_font_white
-            cell.fill = header_fill
-            cell.border = thin_border
-
-        for row_idx, (menu, data) in enumerate(menu_summary.items(), 2):
-            ws4.cell(row=row_idx, column=1, value=menu).border = thin_border
-            ws4.cell(row=row_idx, column=2, value=data["procedure_count"]).border = thin_border
-            ws4.cell(row=row_idx, column=3, value=data["call_count"]).border = thin_border
-            ws4.cell(row=row_idx, column=4, value=", ".join(data["forms"][:5])).border = thin_border
-
-        self._auto_adjust_width(ws4)
+        self._write_sheet(
+            wb.create_sheet(title="메뉴별요약"),
+            ["메뉴", "프로시저수", "호출횟수", "관련폼"],
+            [
+                [menu, data["procedure_count"], data["call_count"], ", ".join(data["forms"][:5])]
+                for menu, data in menu_summary.items()
+            ]
+        )
 
         # === Sheet 5: 메뉴별 상세 (NEW!) ===
-        ws5 = wb.create_sheet(title="메뉴별상세")
-
-        headers5 = ["메뉴", "프로시저명", "관련폼"]
-        for col, header in enumerate(headers5, 1):
-            cell = ws5.cell(row=1, column=col, value=header)
-            cell.font = header_font_white
-            cell.fill = header_fill
-            cell.border = thin_border
-
-        row_idx = 2
+        rows5 = []
         for menu, data in menu_summary.items():
             for proc in data["procedures"]:
                 # 이 프로시저를 호출하는 폼 목록
                 calling_forms = self.procedure_summaries.get(proc, ProcedureSummary(proc)).calling_forms
-                ws5.cell(row=row_idx, column=1, value=menu).border = thin_border
-                ws5.cell(row=row_idx, column=2, value=proc).border = thin_border
-                ws5.cell(row=row_idx, column=3, value=", ".join(calling_forms[:3])).border = thin_border
-                row_idx += 1
+                rows5.append([menu, proc, ", ".join(calling_forms[:3])])
 
-        self._auto_adjust_width(ws5)
+        self._write_sheet(
+            wb.create_sheet(title="메뉴별상세"),
+            ["메뉴", "프로시저명", "관련폼"],
+            rows5
+        )
 
         # === Sheet 6: 통계 ===
         ws6 = wb.create_sheet(title="통계")
@@ -650,35 +762,55 @@ class BogunProcedureExtractor:
             ("가장 많이 호출되는 프로시저 Top 10", ""),
         ]
 
-        for row_idx, (label, value) in enumerate(stats, 1):
-            ws6.cell(row=row_idx, column=1, value=label).font = Font(bold=True)
-            ws6.cell(row=row_idx, column=2, value=value)
-
         # Top 10 프로시저
-        top_procs = sorted(self.procedure_summaries.values(), key=lambda x: -x.call_count)[:10]
-        for i, proc in enumerate(top_procs, 6):
-            ws6.cell(row=i, column=1, value=proc.procedure_name)
-            ws6.cell(row=i, column=2, value=proc.call_count)
+        top_procs = [(proc.procedure_name, proc.call_count) for proc in sorted_procs[:10]]
 
-        self._auto_adjust_width(ws6)
+        self._auto_adjust_width(ws6, stats + top_procs)
 
-        wb.save(output_file)
-        print(f"Excel 저장 완료: {output_file}")
+        for label, value in stats:
+            label_cell = WriteOnlyCell(ws6, value=label)
+            label_cell.font = header_font
+            ws6.append([label_cell, value])
 
-    def _auto_adjust_width(self, ws):
-        """컬럼 너비 자동 조정"""
-        for col_idx in range(1, ws.max_column + 1):
-            max_length = 0
-            column_letter = get_column_letter(col_idx)
+        for proc_name, call_count in top_procs:
+            ws6.append([proc_name, call_count])
 
-            for row_idx in range(1, min(ws.max_row + 1, 100)):  # 최대 100행만 체크
-                cell = ws.cell(row=row_idx, column=col_idx)
-                if cell.value:
-                    length = sum(2 if ord(c) > 127 else 1 for c in str(cell.value))
-                    max_length = max(max_length, length)
+        wb.save(output_file)
+        print(f"Excel 저장 완료: {output_file}")
 
-            adjusted_width = min(max_length + 2, 60)
-            ws.column_dimensions[column_letter].width = adjusted_width
+    def _write_sheet(self, ws, headers: List[str], rows: List[list]):
+        """write-only 시트에 헤더 + 데이터 행 기록 (등록된 이름 있는 스타일 적용)"""
+        # write-only 시트는 컬럼 너비를 행 추가 전에 설정해야 함
+        self._auto_adjust_width(ws, [headers] + rows)
+
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = HEADER_STYLE
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        for row in rows:
+            data_cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = BORDERED_STYLE
+                data_cells.append(cell)
+            ws.append(data_cells)
+
+    def _auto_adjust_width(self, ws, rows: list):
+        """컬럼 너비 자동 조정 (기록할 행 값을 1회 순회하며 컬럼별 최대 길이 누적)"""
+        widths = [0] * max((len(row) for row in rows), default=0)
+
+        for row in rows[:99]:  # 상위 99행만 체크
+            for col_idx, value in enumerate(row):
+                if value:
+                    length = _display_width(str(value))
+                    if length > widths[col_idx]:
+                        widths[col_idx] = length
+
+        for col_idx, max_length in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 60)
 
     def print_statistics(self):
         """통계 출력"""
@@ -24,7 +24,13 @@ MSSQL_CONFIG = {
     "port": 1433,
     "database": "YOUR_DATABASE",
     "user": "YOUR_USER",
-    "password": "YOUR_PASSWORD"
+    "password": "YOUR_PASSWORD",
+    # pyodbc로 조회할 때 사용할 ODBC 드라이버 (지정한 경우에만 pyodbc 사용, 생략하면 pymssql)
+    # "odbc_driver": "ODBC Driver 18 for SQL Server",
+    # ODBC 연결 암호화 옵션 - Driver 18은 기본이 Encrypt=yes + 인증서 검증이므로
+    # 자체 서명 인증서를 쓰는 서버는 trust_server_certificate를 "yes"로 지정
+    # "encrypt": "yes",
+    # "trust_server_certificate": "yes",
 }
 
 # Gemini API 키 (환경변수에서 로드)
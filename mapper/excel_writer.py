@@ -1,172 +1,260 @@
 import csv
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import groupby
 from pathlib import Path
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle, DEFAULT_FONT
 from openpyxl.utils import get_column_letter
-from typing import List
+from openpyxl.worksheet.dimensions import ColumnDimension
+from typing import List, Optional
 from .oracle_mapper import ColumnInfo, TableInfo
 
+# 셀 스타일 이름 (NamedStyle로 한 번만 등록하고 셀에는 이름만 지정)
+HEADER_STYLE = "header"
+SECTION_STYLE = "section"
+MAPPED_STYLE = "body_mapped"
+UNMAPPED_STYLE = "body_unmapped"
+
+# 백그라운드 Excel 저장용 스레드 풀 (save_async)
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# CSV 쓰기 버퍼 크기 (1MB)
+CSV_BUFFER_SIZE = 1 << 20
+
+# 입력/출력 시트 컬럼 수 (섹션 헤더 병합 범위 A~I)
+SHEET_COLUMN_COUNT = 9
+
+
+@lru_cache(maxsize=4096)
+def _visual_len(text: str) -> int:
+    """표시 너비 계산 (한글 등 비ASCII 문자는 2배 너비)"""
+    if text.isascii():
+        return len(text)
+    # 비ASCII 문자 수 = 전체 길이 - ASCII 문자 수 (문자 단위 루프 없이 C 레벨에서 계산)
+    return 2 * len(text) - len(text.encode('ascii', 'ignore'))
+
+
+def _unique_tables(table_infos: List[TableInfo]) -> List[TableInfo]:
+    """(한글명, 영문명) 기준 중복 제거 (처음 나온 순서 보존)"""
+    # 같은 키의 TableInfo는 내용도 같으므로 dict 컴프리헨션 한 번으로 처리 (순서는 첫 등장 위치 유지)
+    return list({(info.table_kor, info.table_eng): info for info in table_infos}.values())
+
+
+def _update_col_widths(col_widths: List[int], value_rows: list):
+    """컬럼별 최대 표시 너비 일괄 갱신 (열 단위로 중복 값을 먼저 제거한 뒤 map/max로 처리, 빈 값 제외)"""
+    for idx, column in enumerate(zip(*value_rows)):
+        width = max(map(_visual_len, map(str, filter(None, set(column)))), default=0)
+        if width > col_widths[idx]:
+            col_widths[idx] = width
+
+
+def _set_column_widths(ws, widths: list):
+    """컬럼 너비 설정 (연속된 같은 너비는 ColumnDimension 하나로 묶어서 지정)"""
+    col_idx = 1
+    for width, group in groupby(widths):
+        span = len(list(group))
+        letter = get_column_letter(col_idx)
+        ws.column_dimensions[letter] = ColumnDimension(
+            ws, index=letter, min=col_idx, max=col_idx + span - 1, width=width
+        )
+        col_idx += span
+
+
+def _param_fields(param) -> tuple:
+    """파라미터 (이름, 데이터타입) 추출 (dict 또는 문자열)"""
+    if isinstance(param, dict):
+        return param.get("name", ""), param.get("type", "")
+    return str(param), ""
+
+
+def _table_csv_rows(table_infos: List[TableInfo]) -> list:
+    """테이블 정보 CSV 행 목록 (중복 제거)"""
+    return [
+        (info.table_kor, info.table_eng, "O" if info.is_mapped else "X")
+        for info in _unique_tables(table_infos)
+    ]
+
+
+def _column_csv_rows(column_infos: List[ColumnInfo]) -> list:
+    """항목 정보 CSV 행 목록"""
+    return [
+        (
+            info.table_kor, info.table_eng, info.col_kor, info.col_eng,
+            info.data_type, info.length, info.pk, info.fk, info.old_table_eng,
+            "O" if info.is_mapped else "X"
+        )
+        for info in column_infos
+    ]
+
 
 class ExcelWriter:
     """Excel 출력 모듈"""
 
-    def __init__(self):
-        self.wb = Workbook()
+    @cached_property
+    def wb(self) -> Workbook:
+        """
+        write-only 워크북 (처음 시트를 만들 때 생성)
+
+        CSV만 저장하는 경우에는 워크북과 스타일 객체를 만들지 않음
+        """
+        # write-only 모드: 셀 격자를 메모리에 만들지 않고 행 단위로 스트리밍 기록
+        wb = Workbook(write_only=True)
+
         # 기본 스타일
-        self.header_font = Font(bold=True)
-        self.header_fill = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
-        self.section_font = Font(bold=True, size=12)
-        self.section_fill = PatternFill(start_color="868e96", end_color="868e96", fill_type="solid")
-        self.section_font_white = Font(bold=True, size=12, color="FFFFFF")
-        self.thin_border = Border(
+        header_font = Font(bold=True)
+        header_fill = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
+        section_fill = PatternFill(start_color="868e96", end_color="868e96", fill_type="solid")
+        section_font_white = Font(bold=True, size=12, color="FFFFFF")
+        thin_border = Border(
             left=Side(style='thin'),
             right=Side(style='thin'),
             top=Side(style='thin'),
             bottom=Side(style='thin')
         )
-        self.unmapped_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+        unmapped_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+
+        # 폰트/채우기/테두리 조합별 NamedStyle 등록
+        wb.add_named_style(NamedStyle(
+            name=HEADER_STYLE, font=header_font, fill=header_fill, border=thin_border
+        ))
+        wb.add_named_style(NamedStyle(
+            name=SECTION_STYLE, font=section_font_white, fill=section_fill
+        ))
+        wb.add_named_style(NamedStyle(
+            name=MAPPED_STYLE, font=DEFAULT_FONT, border=thin_border
+        ))
+        wb.add_named_style(NamedStyle(
+            name=UNMAPPED_STYLE, font=DEFAULT_FONT, fill=unmapped_fill, border=thin_border
+        ))
+        return wb
+
+    def _cell(self, ws, value, style: Optional[str] = None):
+        """write-only 셀 생성 (style: 등록된 NamedStyle 이름)"""
+        cell = WriteOnlyCell(ws, value=value)
+        if style:
+            cell.style = style
+        return cell
 
     def create_description_sheet(self, proc_name: str, description: str, parameters: list):
         """설명 시트 생성"""
-        ws = self.wb.active
-        ws.title = "설명"
+        # write-only 모드에는 기본 시트가 없으므로 맨 앞에 생성
+        ws = self.wb.create_sheet(title="설명", index=0)
+
+        # 컬럼 너비 조정 (write-only 모드는 첫 행 추가 전에 설정해야 함)
+        _set_column_widths(ws, [20] * 4)
 
         current_row = 1
 
-        # 프로시저 이름
-        cell = ws.cell(row=current_row, column=1, value="프로시저 이름")
-        cell.font = self.header_font
-        cell.fill = self.header_fill
-        cell.border = self.thin_border
-        ws.cell(row=current_row, column=2, value=proc_name).border = self.thin_border
-        ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=4)
+        # 프로시저 이름 (병합 영역 테두리도 함께 기록)
+        ws.append([
+            self._cell(ws, "프로시저 이름", HEADER_STYLE),
+            self._cell(ws, proc_name, MAPPED_STYLE),
+            self._cell(ws, None, MAPPED_STYLE),
+            self._cell(ws, None, MAPPED_STYLE),
+        ])
+        ws.merged_cells.add(f"B{current_row}:D{current_row}")
+        ws.append([])
         current_row += 2
 
         # 파라미터 섹션
-        cell = ws.cell(row=current_row, column=1, value="[파라미터]")
-        cell.font = self.section_font_white
-        cell.fill = self.section_fill
-        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=4)
+        ws.append([self._cell(ws, "[파라미터]", SECTION_STYLE)])
+        ws.merged_cells.add(f"A{current_row}:D{current_row}")
         current_row += 1
 
         # 파라미터 헤더
         headers = ["파라미터명", "데이터타입"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=current_row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.border = self.thin_border
+        ws.append([self._cell(ws, header, HEADER_STYLE) for header in headers])
         current_row += 1
 
         # 파라미터 데이터
-        for param in parameters:
-            if isinstance(param, dict):
-                name = param.get("name", "")
-                ptype = param.get("type", "")
-            else:
-                name = str(param)
-                ptype = ""
-            ws.cell(row=current_row, column=1, value=name).border = self.thin_border
-            ws.cell(row=current_row, column=2, value=ptype).border = self.thin_border
-            current_row += 1
+        for row in map(_param_fields, parameters):
+            ws.append([self._cell(ws, value, MAPPED_STYLE) for value in row])
+        current_row += len(parameters)
 
+        ws.append([])
         current_row += 1
 
         # 설명 섹션
-        cell = ws.cell(row=current_row, column=1, value="[프로시저 설명]")
-        cell.font = self.section_font_white
-        cell.fill = self.section_fill
-        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=4)
+        ws.append([self._cell(ws, "[프로시저 설명]", SECTION_STYLE)])
+        ws.merged_cells.add(f"A{current_row}:D{current_row}")
         current_row += 1
 
-        # 설명 내용
-        desc_cell = ws.cell(row=current_row, column=1, value=description)
-        desc_cell.alignment = Alignment(wrap_text=True, vertical='top')
-        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row + 5, end_column=4)
+        # 설명 내용 (행 높이도 행 추가 전에 설정)
         ws.row_dimensions[current_row].height = 100
-
-        # 컬럼 너비 조정
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 20
+        desc_cell = self._cell(ws, description)
+        desc_cell.alignment = Alignment(wrap_text=True, vertical='top')
+        ws.append([desc_cell])
+        ws.merged_cells.add(f"A{current_row}:D{current_row + 5}")
 
     def create_sheet(self, title: str, table_infos: List[TableInfo], column_infos: List[ColumnInfo]):
         """시트 생성 (입력/출력용)"""
-        # 설명 시트가 이미 있으면 새 시트 생성
         ws = self.wb.create_sheet(title=title)
 
-        current_row = 1
+        # write-only 모드는 컬럼 너비를 첫 행 추가 전에 정해야 하므로 행을 먼저 모두 구성
+        # (행을 만들면서 컬럼별 최대 표시 너비도 함께 누적)
+        rows = []
+        col_widths = [0] * SHEET_COLUMN_COUNT
 
         # === 테이블 정보 섹션 ===
-        current_row = self._write_section_header(ws, current_row, "테이블 정보")
-        current_row = self._write_table_info(ws, current_row, table_infos)
-        current_row += 1  # 빈 줄
+        self._write_section_header(ws, rows, col_widths, "테이블 정보")
+        self._write_table_info(ws, rows, col_widths, table_infos)
+        rows.append([])  # 빈 줄
 
         # === 항목 정보 섹션 ===
-        current_row = self._write_section_header(ws, current_row, "항목 정보")
-        current_row = self._write_column_info(ws, current_row, column_infos)
+        self._write_section_header(ws, rows, col_widths, "항목 정보")
+        self._write_column_info(ws, rows, col_widths, column_infos)
 
         # 컬럼 너비 조정
-        self._auto_adjust_column_width(ws)
+        self._auto_adjust_column_width(ws, col_widths)
+
+        for row in rows:
+            ws.append(row)
+
+    def _append_row(self, ws, rows: list, col_widths: List[int], values: list, style: Optional[str]):
+        """행 추가 (컬럼별 최대 표시 너비 갱신)"""
+        self._append_rows(ws, rows, col_widths, [values], [style])
+
+    def _append_rows(self, ws, rows: list, col_widths: List[int], value_rows: list, styles: list):
+        """같은 컬럼 구성의 여러 행 추가 (컬럼별 최대 표시 너비는 열 단위로 일괄 갱신)"""
+        _update_col_widths(col_widths, value_rows)
+        cell = self._cell
+        rows.extend(
+            [cell(ws, value, style) for value in values]
+            for values, style in zip(value_rows, styles)
+        )
 
-    def _write_section_header(self, ws, row: int, title: str) -> int:
+    def _write_section_header(self, ws, rows: list, col_widths: List[int], title: str):
         """섹션 헤더 작성"""
-        cell = ws.cell(row=row, column=1, value=f"[{title}]")
-        cell.font = self.section_font_white
-        cell.fill = self.section_fill
+        row = len(rows) + 1
+        self._append_row(ws, rows, col_widths, [f"[{title}]"], SECTION_STYLE)
         # 병합
-        ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=9)
-        return row + 1
+        ws.merged_cells.add(f"A{row}:{get_column_letter(SHEET_COLUMN_COUNT)}{row}")
 
-    def _write_table_info(self, ws, row: int, table_infos: List[TableInfo]) -> int:
+    def _write_table_info(self, ws, rows: list, col_widths: List[int], table_infos: List[TableInfo]):
         """테이블 정보 작성"""
         # 헤더
         headers = ["관련테이블 한글명", "관련테이블 영문명"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.border = self.thin_border
-        row += 1
-
-        # 데이터 (중복 제거)
-        seen = set()
-        for info in table_infos:
-            key = (info.table_kor, info.table_eng)
-            if key in seen:
-                continue
-            seen.add(key)
-
-            cell1 = ws.cell(row=row, column=1, value=info.table_kor)
-            cell2 = ws.cell(row=row, column=2, value=info.table_eng)
-
-            cell1.border = self.thin_border
-            cell2.border = self.thin_border
-
-            # 매핑 없음 표시
-            if not info.is_mapped:
-                cell1.fill = self.unmapped_fill
-                cell2.fill = self.unmapped_fill
-
-            row += 1
-
-        return row
+        self._append_row(ws, rows, col_widths, headers, HEADER_STYLE)
+
+        # 데이터 (중복 제거, 매핑 없음 표시)
+        unique = _unique_tables(table_infos)
+        self._append_rows(
+            ws, rows, col_widths,
+            [(info.table_kor, info.table_eng) for info in unique],
+            [MAPPED_STYLE if info.is_mapped else UNMAPPED_STYLE for info in unique]
+        )
 
-    def _write_column_info(self, ws, row: int, column_infos: List[ColumnInfo]) -> int:
+    def _write_column_info(self, ws, rows: list, col_widths: List[int], column_infos: List[ColumnInfo]):
         """항목 정보 작성"""
         # 헤더
         headers = ["테이블 한글명", "테이블 영문명", "항목 한글명", "항목 영문명", "유형", "길이", "PK", "FK", "기존 테이블 영문명"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.border = self.thin_border
-        row += 1
-
-        # 데이터
-        for info in column_infos:
-            values = [
+        self._append_row(ws, rows, col_widths, headers, HEADER_STYLE)
+
+        # 데이터 (매핑 없음 표시)
+        value_rows = [
+            (
                 info.table_kor,
                 info.table_eng,
                 info.col_kor,
@@ -176,65 +264,35 @@ class ExcelWriter:
                 info.pk,
                 info.fk,
                 info.old_table_eng
-            ]
-            for col, value in enumerate(values, 1):
-                cell = ws.cell(row=row, column=col, value=value)
-                cell.border = self.thin_border
-
-                # 매핑 없음 표시
-                if not info.is_mapped:
-                    cell.fill = self.unmapped_fill
-
-            row += 1
-
-        return row
-
-    def _auto_adjust_column_width(self, ws):
-        """컬럼 너비 자동 조정"""
-        from openpyxl.cell.cell import MergedCell
-        from openpyxl.utils import get_column_letter
-
-        for col_idx in range(1, ws.max_column + 1):
-            max_length = 0
-            column_letter = get_column_letter(col_idx)
-
-            for row_idx in range(1, ws.max_row + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                try:
-                    # 병합된 셀은 건너뛰기
-                    if isinstance(cell, MergedCell):
-                        continue
-                    if cell.value:
-                        # 한글은 2배 너비
-                        length = sum(2 if ord(c) > 127 else 1 for c in str(cell.value))
-                        max_length = max(max_length, length)
-                except:
-                    pass
-
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            )
+            for info in column_infos
+        ]
+        styles = [MAPPED_STYLE if info.is_mapped else UNMAPPED_STYLE for info in column_infos]
+        self._append_rows(ws, rows, col_widths, value_rows, styles)
+
+    def _auto_adjust_column_width(self, ws, col_widths: List[int]):
+        """컬럼 너비 자동 조정 (누적된 최대 표시 너비 기준, 컬럼 수만큼만 순회)"""
+        _set_column_widths(ws, [min(max_length + 2, 50) for max_length in col_widths])
 
     def save(self, filepath: str):
         """파일 저장"""
         self.wb.save(filepath)
         print(f"Excel 파일 저장 완료: {filepath}")
 
+    def save_async(self, filepath: str) -> Future:
+        """파일 저장을 백그라운드 스레드에서 실행 (완료 대기: 반환된 Future.result())"""
+        return _SAVE_EXECUTOR.submit(self.save, filepath)
+
     def save_csv(self, filepath: str, table_infos: List[TableInfo], column_infos: List[ColumnInfo], sheet_type: str = ""):
         """CSV 파일 저장"""
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # 테이블 정보 섹션
             writer.writerow([f"[{sheet_type} 테이블 정보]"])
             writer.writerow(["관련테이블 한글명", "관련테이블 영문명", "매핑여부"])
 
-            seen = set()
-            for info in table_infos:
-                key = (info.table_kor, info.table_eng)
-                if key in seen:
-                    continue
-                seen.add(key)
-                writer.writerow([info.table_kor, info.table_eng, "O" if info.is_mapped else "X"])
+            writer.writerows(_table_csv_rows(table_infos))
 
             writer.writerow([])  # 빈 줄
 
@@ -242,19 +300,7 @@ class ExcelWriter:
             writer.writerow([f"[{sheet_type} 항목 정보]"])
             writer.writerow(["테이블 한글명", "테이블 영문명", "항목 한글명", "항목 영문명", "유형", "길이", "PK", "FK", "기존 테이블 영문명", "매핑여부"])
 
-            for info in column_infos:
-                writer.writerow([
-                    info.table_kor,
-                    info.table_eng,
-                    info.col_kor,
-                    info.col_eng,
-                    info.data_type,
-                    info.length,
-                    info.pk,
-                    info.fk,
-                    info.old_table_eng,
-                    "O" if info.is_mapped else "X"
-                ])
+            writer.writerows(_column_csv_rows(column_infos))
 
         print(f"CSV 파일 저장 완료: {filepath}")
 
@@ -270,7 +316,7 @@ class ExcelWriter:
         output_columns: List[ColumnInfo]
     ):
         """통합 CSV 파일 저장 (프로시저 정보 + 입력 + 출력)"""
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # [프로시저 정보]
@@ -282,60 +328,31 @@ class ExcelWriter:
             # [파라미터]
             writer.writerow(["[파라미터]"])
             writer.writerow(["파라미터명", "데이터타입"])
-            for param in parameters:
-                if isinstance(param, dict):
-                    name = param.get("name", "")
-                    ptype = param.get("type", "")
-                else:
-                    name = str(param)
-                    ptype = ""
-                writer.writerow([name, ptype])
+            writer.writerows([_param_fields(param) for param in parameters])
             writer.writerow([])
 
             # [입력 테이블 정보]
             writer.writerow(["[입력 테이블 정보]"])
             writer.writerow(["관련테이블 한글명", "관련테이블 영문명", "매핑여부"])
-            seen = set()
-            for info in input_tables:
-                key = (info.table_kor, info.table_eng)
-                if key in seen:
-                    continue
-                seen.add(key)
-                writer.writerow([info.table_kor, info.table_eng, "O" if info.is_mapped else "X"])
+            writer.writerows(_table_csv_rows(input_tables))
             writer.writerow([])
 
             # [입력 항목 정보]
             writer.writerow(["[입력 항목 정보]"])
             writer.writerow(["테이블 한글명", "테이블 영문명", "항목 한글명", "항목 영문명", "유형", "길이", "PK", "FK", "기존 테이블 영문명", "매핑여부"])
-            for info in input_columns:
-                writer.writerow([
-                    info.table_kor, info.table_eng, info.col_kor, info.col_eng,
-                    info.data_type, info.length, info.pk, info.fk, info.old_table_eng,
-                    "O" if info.is_mapped else "X"
-                ])
+            writer.writerows(_column_csv_rows(input_columns))
             writer.writerow([])
 
             # [출력 테이블 정보]
             writer.writerow(["[출력 테이블 정보]"])
             writer.writerow(["관련테이블 한글명", "관련테이블 영문명", "매핑여부"])
-            seen = set()
-            for info in output_tables:
-                key = (info.table_kor, info.table_eng)
-                if key in seen:
-                    continue
-                seen.add(key)
-                writer.writerow([info.table_kor, info.table_eng, "O" if info.is_mapped else "X"])
+            writer.writerows(_table_csv_rows(output_tables))
             writer.writerow([])
 
             # [출력 항목 정보]
             writer.writerow(["[출력 항목 정보]"])
             writer.writerow(["테이블 한글명", "테이블 영문명", "항목 한글명", "항목 영문명", "유형", "길이", "PK", "FK", "기존 테이블 영문명", "매핑여부"])
-            for info in output_columns:
-                writer.writerow([
-                    info.table_kor, info.table_eng, info.col_kor, info.col_eng,
-                    info.data_type, info.length, info.pk, info.fk, info.old_table_eng,
-                    "O" if info.is_mapped else "X"
-                ])
+            writer.writerows(_column_csv_rows(output_columns))
 
         print(f"CSV 파일 저장 완료: {filepath}")
 
@@ -1,13 +1,74 @@
+import os
+import re
 import json
 import time
+import hashlib
+import threading
 import google.generativeai as genai
-from typing import Optional
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
+from dataclasses import asdict, dataclass, field
 from .config import GEMINI_API_KEY, GEMINI_API_KEYS
-from .sql_parser import SQLParser
+from .sql_parser import PARSER_VERSION, SQLParser
 
+# orjson (선택): 설치되어 있으면 JSON 파싱에 사용
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+# 사용 모델
+GEMINI_MODEL = 'gemini-3-pro-preview'
+
+# 응답 캐시 디렉토리 (프롬프트 해시 → 응답 텍스트)
+CACHE_DIR = Path(__file__).parent.parent / ".gemini_cache"
+
+# 분석기 코드(프롬프트, 응답 파싱)가 바뀌면 이전 분석 결과 캐시를 쓰지 않도록 키에 포함
+ANALYZER_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+# 마크다운 코드블록 본문 추출 (```json 블록 우선, 닫는 ``` 없으면 끝까지)
+JSON_FENCE_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+FENCE_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+# genai.configure는 프로세스 전역 설정을 바꾸므로, 키 설정과 그 키로의 호출을 잠금 안에서 한 번에 수행
+# (SDK 내부 클라이언트를 직접 바인딩하지 않는 대신 동시에 나가는 API 호출은 1개로 직렬화됨)
+_CONFIGURE_LOCK = threading.Lock()
+
+
+def _generate_content(api_key: str, prompt: str, temperature: float):
+    """지정한 API 키로 Gemini 호출 (다른 스레드가 중간에 다른 키로 configure 하지 못하도록 잠금)"""
+    with _CONFIGURE_LOCK:
+        genai.configure(api_key=api_key)
+        return genai.GenerativeModel(GEMINI_MODEL).generate_content(
+            prompt,
+            generation_config=genai.types.GenerationConfig(
+                temperature=temperature,
+            ),
+            request_options={"timeout": 120}
+        )
+
+
+def _atomic_write_text(path: Path, text: str):
+    """캐시 파일 저장 (임시 파일에 쓴 뒤 교체하여 동시 실행 시에도 깨진 파일이 보이지 않게 함)
+
+    저장 실패(읽기 전용 경로, 디스크 부족 등)는 분석을 중단하지 않고 캐시만 건너뜀
+    """
+    tmp_file = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(text, encoding='utf-8')
+        os.replace(tmp_file, path)
+    except OSError as e:
+        print(f"    (캐시 저장 실패: {e})")
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+@dataclass(slots=True)
 class TableUsage:
     """테이블 사용 정보"""
     name: str
@@ -16,7 +77,7 @@ class TableUsage:
     is_derived: bool = False  # Derived Table (인라인 뷰) 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnMapping:
     """컬럼 매핑 정보"""
     table: str
@@ -25,7 +86,7 @@ class ColumnMapping:
     is_derived: bool = False  # Derived Table 컬럼 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """프로시저 분석 결과"""
     description: str = ""  # 프로시저 설명
@@ -138,109 +199,227 @@ PHASE2_JSON_PROMPT = """
 """
 
 
+# 프롬프트를 고정 앞/뒤 부분으로 미리 분리 (호출마다 .format 파싱 없이 문자열 연결만 수행)
+# 센티널로 한 번 format 해서 분리하므로 {{ }} 이스케이프도 미리 풀린 상태
+PHASE1_HEAD, PHASE1_TAIL = PHASE1_ANALYSIS_PROMPT.format(parser_hint="\0").split("\0")
+PHASE2_HEAD, PHASE2_TAIL = PHASE2_JSON_PROMPT.format(analysis_text="\0").split("\0")
+
+
 class GeminiAnalyzer:
     """Gemini API를 사용한 프로시저 분석기"""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, use_cache: bool = True):
         self.api_key = api_key or GEMINI_API_KEY
         self.api_keys = GEMINI_API_KEYS if GEMINI_API_KEYS else [self.api_key]
         self.current_key_index = 0
+        self.use_cache = use_cache
 
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
 
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-3-pro-preview')
+        # analyze()에서 사용하는 API 키 (429 에러 시 _switch_api_key로 전환)
+        self.current_api_key = self.api_key
 
     def _switch_api_key(self):
         """API 키 전환 (429 에러 대응)"""
         if len(self.api_keys) > 1:
             self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
-            new_key = self.api_keys[self.current_key_index]
-            genai.configure(api_key=new_key)
+            self.current_api_key = self.api_keys[self.current_key_index]
             return True
         return False
 
+    def _response_cache_file(self, prompt: str, temperature: float) -> Optional[Path]:
+        """모델/temperature/프롬프트 조합의 응답 캐시 파일 (캐시 미사용 시 None)"""
+        if not self.use_cache:
+            return None
+        key = hashlib.sha256(f"{GEMINI_MODEL}\0{temperature}\0{prompt}".encode('utf-8')).hexdigest()
+        return CACHE_DIR / f"{key}.txt"
+
+    def _save_response(self, prompt: str, temperature: float, text: str):
+        """검증을 마친 응답을 캐시에 저장"""
+        cache_file = self._response_cache_file(prompt, temperature)
+        if cache_file is not None:
+            _atomic_write_text(cache_file, text)
+
+    def _generate(self, api_key: str, prompt: str, temperature: float, cache_response: bool = True) -> str:
+        """
+        Gemini 호출 (디스크 캐시 사용)
+
+        동일한 모델/temperature/프롬프트 조합은 이전 응답을 재사용
+
+        Args:
+            cache_response: False면 새 응답을 저장하지 않음 (호출한 쪽에서 검증 후 _save_response)
+
+        Returns:
+            응답 텍스트 (strip 적용)
+        """
+        cache_file = self._response_cache_file(prompt, temperature)
+        if cache_file is not None and cache_file.exists():
+            print("    (캐시된 응답 사용)")
+            return cache_file.read_text(encoding='utf-8')
+
+        response = _generate_content(api_key, prompt, temperature)
+        text = response.text.strip()
+
+        if cache_response and cache_file is not None:
+            _atomic_write_text(cache_file, text)
+
+        return text
+
     def analyze(self, procedure_text: str) -> AnalysisResult:
         """프로시저 텍스트 분석 (3-phase 방식: 파서 → 분석 → JSON)"""
         try:
-            start_time = time.time()
-
-            # ========================================
-            # Phase 0: SQL 파서 전처리
-            # ========================================
-            print("  [Phase 0] SQL 파서 전처리 중...")
-            parser = SQLParser()
-            parse_result = parser.parse(procedure_text)
-            parser_hint = parser.to_structured_text(parse_result)
-            print(f"  [Phase 0] 완료 (테이블 {len(parse_result.all_tables)}개, 컬럼 {len(parse_result.all_select_columns)}개 추출)")
-
-            # ========================================
-            # Phase 1: 프로시저 분석 (자연어 출력)
-            # ========================================
-            phase1_prompt = PHASE1_ANALYSIS_PROMPT.format(parser_hint=parser_hint) + procedure_text
-
-            print("  [Phase 1] 프로시저 분석 중...")
-            phase1_response = self.model.generate_content(
-                phase1_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,
-                ),
-                request_options={"timeout": 120}
-            )
-            analysis_text = phase1_response.text.strip()
-            phase1_time = time.time() - start_time
-            print(f"  [Phase 1] 완료 ({phase1_time:.2f}초)")
-
-            # ========================================
-            # Phase 2: JSON 변환
-            # ========================================
-            phase2_prompt = PHASE2_JSON_PROMPT.format(analysis_text=analysis_text)
-
-            print("  [Phase 2] JSON 변환 중...")
-            phase2_start = time.time()
-            phase2_response = self.model.generate_content(
-                phase2_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # JSON 변환은 약간 낮은 temperature
-                ),
-                request_options={"timeout": 120}
-            )
-            json_text = phase2_response.text.strip()
-            phase2_time = time.time() - phase2_start
-            print(f"  [Phase 2] 완료 ({phase2_time:.2f}초)")
-
-            elapsed_time = time.time() - start_time
-
-            # JSON 파싱
-            result = self._parse_response(json_text)
-            result.raw_response = f"=== Phase 1 분석 결과 ===\n{analysis_text}\n\n=== Phase 2 JSON 변환 ===\n{json_text}"
-            result.response_time = elapsed_time
-            return result
-
+            return self._run_phases(procedure_text, self.current_api_key)
         except Exception as e:
             if "429" in str(e) and self._switch_api_key():
                 # 키 전환 후 재시도
                 return self.analyze(procedure_text)
             raise
 
-    def _parse_response(self, response_text: str) -> AnalysisResult:
-        """Gemini 응답 파싱"""
-        # 마크다운 코드블록 제거
-        text = response_text
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
+    def analyze_many(
+        self,
+        procedure_texts: List[str],
+        return_exceptions: bool = False
+    ) -> List[Union[AnalysisResult, Exception]]:
+        """
+        여러 프로시저 병렬 분석
+
+        캐시 조회/파서/응답 파싱은 스레드로 동시에 진행하고, 프로시저마다 API 키를 라운드로빈으로 나눠
+        키별 호출 제한을 분산 (API 호출 자체는 _CONFIGURE_LOCK으로 한 번에 1개씩 나감)
+
+        Args:
+            return_exceptions: True면 실패한 프로시저는 예외 객체를 결과 자리에 담아 반환 (나머지 결과는 유지)
+
+        Returns:
+            입력 순서와 같은 순서의 분석 결과 목록
+        """
+        key_count = len(self.api_keys)
+        with ThreadPoolExecutor(max_workers=key_count * 2) as executor:
+            futures = [
+                executor.submit(self._analyze_with_key, text, i % key_count)
+                for i, text in enumerate(procedure_texts)
+            ]
+            if not return_exceptions:
+                return [future.result() for future in futures]
+            return [future.exception() or future.result() for future in futures]
+
+    def _analyze_with_key(self, procedure_text: str, key_index: int) -> AnalysisResult:
+        """지정한 API 키로 분석 (429 에러 시 다음 키로 재시도, 키마다 1회)"""
+        key_count = len(self.api_keys)
+        for attempt in range(key_count):
+            try:
+                return self._run_phases(procedure_text, self.api_keys[key_index])
+            except Exception as e:
+                if "429" in str(e) and attempt + 1 < key_count:
+                    key_index = (key_index + 1) % key_count
+                    continue
+                raise
+
+    def _run_phases(self, procedure_text: str, api_key: str) -> AnalysisResult:
+        """3-phase 분석 실행 (파서 → 분석 → JSON, 같은 프로시저 본문은 캐시된 분석 결과 사용)"""
+        start_time = time.time()
+
+        analysis_cache_file = None
+        if self.use_cache:
+            # 분석기(프롬프트, 응답 파싱)나 파서(Phase 1 프롬프트에 들어가는 전처리 결과)가 바뀌면
+            # 분석 결과도 달라지므로 키에 함께 포함
+            key = hashlib.blake2b(
+                f"{GEMINI_MODEL}\0{ANALYZER_VERSION}\0{PARSER_VERSION}\0{procedure_text}".encode('utf-8'),
+                digest_size=16
+            ).hexdigest()
+            analysis_cache_file = CACHE_DIR / f"analysis_{key}.json"
+            if analysis_cache_file.exists():
+                try:
+                    result = self._result_from_dict(_json_loads(analysis_cache_file.read_bytes()))
+                except Exception:
+                    # 깨진 캐시(잘린 파일, 필드가 바뀐 이전 형식)는 삭제하고 다시 분석
+                    try:
+                        analysis_cache_file.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                else:
+                    print("  (캐시된 분석 결과 사용)")
+                    result.response_time = time.time() - start_time
+                    return result
+
+        # ========================================
+        # Phase 0: SQL 파서 전처리
+        # ========================================
+        print("  [Phase 0] SQL 파서 전처리 중...")
+        parser = SQLParser(use_cache=self.use_cache)
+        parse_result = parser.parse(procedure_text)
+        parser_hint = parser.to_structured_text(parse_result)
+        print(f"  [Phase 0] 완료 (테이블 {len(parse_result.all_tables)}개, 컬럼 {len(parse_result.all_select_columns)}개 추출)")
+
+        # ========================================
+        # Phase 1: 프로시저 분석 (자연어 출력)
+        # ========================================
+        phase1_prompt = PHASE1_HEAD + parser_hint + PHASE1_TAIL + procedure_text
+
+        print("  [Phase 1] 프로시저 분석 중...")
+        analysis_text = self._generate(api_key, phase1_prompt, temperature=0.7)
+        phase1_time = time.time() - start_time
+        print(f"  [Phase 1] 완료 ({phase1_time:.2f}초)")
+
+        # ========================================
+        # Phase 2: JSON 변환
+        # ========================================
+        phase2_prompt = PHASE2_HEAD + analysis_text + PHASE2_TAIL
+
+        print("  [Phase 2] JSON 변환 중...")
+        phase2_start = time.time()
+        # JSON 변환은 약간 낮은 temperature
+        phase2_temperature = 0.3
+        # 깨진 JSON 응답이 캐시에서 계속 재사용되지 않도록 파싱 성공 후에만 저장
+        json_text = self._generate(api_key, phase2_prompt, phase2_temperature, cache_response=False)
+        phase2_time = time.time() - phase2_start
+        print(f"  [Phase 2] 완료 ({phase2_time:.2f}초)")
+
+        elapsed_time = time.time() - start_time
+
+        # JSON 파싱 (실패 시 빈 결과)
+        parsed = self._parse_response(json_text)
+        if parsed is not None:
+            self._save_response(phase2_prompt, phase2_temperature, json_text)
+        else:
+            # 이전 버전이 저장해 둔 깨진 응답이면 삭제하여 다음 실행에서 다시 요청
+            cache_file = self._response_cache_file(phase2_prompt, phase2_temperature)
+            if cache_file is not None:
+                cache_file.unlink(missing_ok=True)
+        result = parsed if parsed is not None else AnalysisResult()
+        result.raw_response = f"=== Phase 1 분석 결과 ===\n{analysis_text}\n\n=== Phase 2 JSON 변환 ===\n{json_text}"
+        result.response_time = elapsed_time
+
+        # JSON 파싱에 실패한 빈 결과는 저장하지 않음 (다음 실행에서 다시 분석)
+        if analysis_cache_file is not None and parsed is not None:
+            _atomic_write_text(analysis_cache_file, json.dumps(asdict(result), ensure_ascii=False))
+        return result
 
-        text = text.strip()
+    @staticmethod
+    def _result_from_dict(data: dict) -> AnalysisResult:
+        """캐시에 저장된 dict → AnalysisResult 복원"""
+        result = AnalysisResult(**data)
+        result.input_columns = [ColumnMapping(**c) for c in result.input_columns]
+        result.output_columns = [ColumnMapping(**c) for c in result.output_columns]
+        result.tables = [TableUsage(**t) for t in result.tables]
+        return result
+
+    def _parse_response(self, response_text: str) -> Optional[AnalysisResult]:
+        """Gemini 응답 파싱 (JSON 객체로 파싱되지 않으면 None)"""
+        # 마크다운 코드블록 제거
+        match = JSON_FENCE_RE.search(response_text) or FENCE_RE.search(response_text)
+        text = (match.group(1) if match else response_text).strip()
 
         try:
-            data = json.loads(text)
+            data = _json_loads(text)
         except json.JSONDecodeError as e:
             print(f"JSON 파싱 오류: {e}")
             print(f"원본 응답: {response_text[:500]}")
-            return AnalysisResult(raw_response=response_text)
+            return None
+        if not isinstance(data, dict):
+            print(f"JSON 파싱 오류: 객체가 아닌 응답 ({type(data).__name__})")
+            print(f"원본 응답: {response_text[:500]}")
+            return None
 
         # 결과 구성
         result = AnalysisResult()
@@ -251,29 +430,44 @@ class GeminiAnalyzer:
         # 파라미터
         result.parameters = data.get("parameters", [])
 
-        # 입력 컬럼 (WHERE 조건)
+        # 입력 컬럼 (WHERE 조건, 응답 내 중복 제거)
+        seen = set()
         for col in data.get("input_columns", []):
+            key = (col.get("table", ""), col.get("column", ""), col.get("parameter", ""), col.get("is_derived", False))
+            if key in seen:
+                continue
+            seen.add(key)
             result.input_columns.append(ColumnMapping(
-                table=col.get("table", ""),
-                column=col.get("column", ""),
-                parameter=col.get("parameter", ""),
-                is_derived=col.get("is_derived", False)
+                table=key[0],
+                column=key[1],
+                parameter=key[2],
+                is_derived=key[3]
             ))
 
-        # 출력 컬럼 (SELECT 절)
+        # 출력 컬럼 (SELECT 절, 응답 내 중복 제거)
+        seen = set()
         for col in data.get("output_columns", []):
+            key = (col.get("table", ""), col.get("column", ""), col.get("is_derived", False))
+            if key in seen:
+                continue
+            seen.add(key)
             result.output_columns.append(ColumnMapping(
-                table=col.get("table", ""),
-                column=col.get("column", ""),
-                is_derived=col.get("is_derived", False)
+                table=key[0],
+                column=key[1],
+                is_derived=key[2]
             ))
 
-        # 테이블 정보
+        # 테이블 정보 (응답 내 중복 제거)
+        seen = set()
         for t in data.get("tables", []):
+            key = (t.get("name", ""), t.get("alias", ""), t.get("is_derived", False))
+            if key in seen:
+                continue
+            seen.add(key)
             result.tables.append(TableUsage(
-                name=t.get("name", ""),
-                alias=t.get("alias", ""),
-                is_derived=t.get("is_derived", False)
+                name=key[0],
+                alias=key[1],
+                is_derived=key[2]
             ))
 
         return result
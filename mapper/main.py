@@ -5,33 +5,72 @@ C# → Java 마이그레이션용 테이블/컬럼 명칭 변환
 """
 import argparse
 import re
+import sqlite3
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, TYPE_CHECKING
 
-from .gemini_analyzer import GeminiAnalyzer, AnalysisResult
-from .oracle_mapper import OracleMapper, TableInfo, ColumnInfo
-from .excel_writer import ExcelWriter
-from .mssql_reader import get_procedure_from_db
+from .oracle_mapper import OracleMapper, OracleQueryError, TableInfo, ColumnInfo
+from .mapping_cache import MappingCache
+
+# google-generativeai/sqlglot, openpyxl, MSSQL 드라이버는 import 비용이 커서 실제 사용하는 단계에서 import
+if TYPE_CHECKING:
+    from .gemini_analyzer import AnalysisResult
+    from .mssql_reader import MSSQLReader
+
+# CREATE PROC [dbo].[프로시저명] 또는 CREATE PROCEDURE dbo.프로시저명
+CREATE_PROC_RE = re.compile(r'CREATE\s+PROC(?:EDURE)?\s+(?:\[?\w+\]?\.)?\[?(\w+)\]?', re.IGNORECASE)
+
+# Gemini 분석 중 Oracle 연결을 미리 여는 백그라운드 스레드
+_MAPPER_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+def _print_lines(lines: List[str]):
+    """여러 줄 진행 메시지를 한 번의 write로 출력 (줄마다 flush 되지 않고 배치 실행 시 다른 출력과 섞이지 않음)"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+@lru_cache(maxsize=4096)
+def _upper_key(name: str) -> str:
+    """배치 조회/캐시 키용 대문자 이름 (이름당 한 번만 변환, intern하여 dict 조회 시 동일 객체 비교)"""
+    return sys.intern(name.upper())
+
+
+def _close_background_mapper(mapper_future):
+    """백그라운드에서 연결한 OracleMapper 종료 (연결 자체가 실패했으면 닫을 것이 없으므로 무시)"""
+    if mapper_future.exception() is None:
+        mapper_future.result().disconnect()
+
+
+def _open_mapping_cache(stack: ExitStack, refresh: bool = False) -> Optional[MappingCache]:
+    """매핑 캐시를 열어 stack에 등록 (refresh면 비움, 열 수 없으면 경고 후 None → 캐시 없이 조회)"""
+    try:
+        cache = stack.enter_context(MappingCache())
+        if refresh:
+            cache.clear()
+    except (OSError, sqlite3.Error) as e:
+        print(f"  ! 매핑 캐시를 사용할 수 없습니다 (캐시 없이 진행): {e}")
+        return None
+    return cache
 
 
 def extract_procedure_name(sql_text: str) -> Optional[str]:
     """프로시저 이름 추출 (정규식)"""
-    # CREATE PROC [dbo].[프로시저명] 또는 CREATE PROCEDURE dbo.프로시저명
-    pattern = r'CREATE\s+PROC(?:EDURE)?\s+(?:\[?\w+\]?\.)?\[?(\w+)\]?'
-    match = re.search(pattern, sql_text, re.IGNORECASE)
+    match = CREATE_PROC_RE.search(sql_text)
     return match.group(1) if match else None
 
 
 def read_procedure_file(filepath: str) -> str:
     """프로시저 파일 읽기"""
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
-
-    with open(path, 'r', encoding='utf-8') as f:
-        return f.read()
+    try:
+        return Path(filepath).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}") from None
 
 
 def remove_sql_comments(sql: str) -> str:
@@ -45,16 +84,97 @@ def remove_sql_comments(sql: str) -> str:
     return sql.strip()
 
 
+def _collect_column_keys(
+    columns: list,
+    resolve: dict,
+    column_requests: set,
+    table_requests: set,
+    star_tables: Optional[List[str]] = None
+) -> Tuple[list, set]:
+    """
+    분석 컬럼 목록 → 매핑 키 목록 수집 (배치 조회 요청도 함께 등록)
+
+    Args:
+        columns: 분석 결과 컬럼 목록 (ColumnMapping)
+        resolve: 이름/별칭 → (원본 테이블명, Derived 여부, Derived일 때 표시할 별칭)
+        column_requests: 배치 조회할 (TABLE, COLUMN) 집합 (추가됨)
+        table_requests: 배치 조회할 TABLE 집합 (추가됨)
+        star_tables: 지정 시 SELECT * 컬럼은 키 대신 여기에 원본 테이블명으로 모음
+
+    Returns:
+        ([(original_table, col, is_derived, alias_if_derived, cache_key), ...], Derived 별칭 집합)
+    """
+    column_keys = []
+    derived_set = set()
+    for c in columns:
+        tbl = c.table
+        col = c.column
+        original_table, is_derived, alias = resolve.get(tbl, (tbl, False, tbl))
+
+        if is_derived or c.is_derived:
+            column_keys.append((original_table, col, True, alias, None))
+            derived_set.add(alias)
+        elif star_tables is not None and col == '*':
+            # SELECT * 컬럼은 별도 처리 (해당 테이블의 모든 컬럼 조회 필요)
+            star_tables.append(original_table)
+            table_requests.add(_upper_key(original_table))
+        else:
+            table_key = _upper_key(original_table)
+            key = (table_key, _upper_key(col))
+            column_keys.append((original_table, col, False, None, key))
+            column_requests.add(key)
+            table_requests.add(table_key)
+    return column_keys, derived_set
+
+
+def _append_column_infos(
+    column_keys: list,
+    mapper: OracleMapper,
+    column_cache: dict,
+    columns_map: dict,
+    table_set: set
+):
+    """매핑 키 목록 → ColumnInfo를 columns_map에 추가 ((table_eng, col_eng) 중복은 먼저 들어온 것 유지, 사용 테이블은 table_set에 추가)"""
+    for original_table, col, is_derived, alias, cache_key in column_keys:
+        if is_derived:
+            col_info = mapper.create_derived_column_info(alias, col)
+        else:
+            # 캐시에서 조회 (키는 수집 시 만든 대문자 키)
+            col_info = column_cache.get(cache_key)
+            if not col_info:
+                col_info = mapper.create_unmapped_column_info(original_table, col)
+            table_set.add(original_table)
+
+        # 중복 체크 후 추가 (dict 삽입 순서 = 출력 순서)
+        columns_map.setdefault((col_info.table_eng, col_info.col_eng), col_info)
+
+
+def _build_table_infos(
+    table_set: set,
+    derived_set: set,
+    mapper: OracleMapper,
+    table_cache: dict
+) -> List[TableInfo]:
+    """사용 테이블/Derived 별칭 → TableInfo 목록"""
+    tables = []
+    for table_name in table_set:
+        table_info = table_cache.get(_upper_key(table_name))
+        if not table_info:
+            table_info = mapper.create_unmapped_table_info(table_name)
+        tables.append(table_info)
+
+    # Derived Table 정보 추가
+    for alias in derived_set:
+        tables.append(mapper.create_derived_table_info(alias))
+    return tables
+
+
 def process_mapping(
-    analysis: AnalysisResult,
-    mapper: OracleMapper
+    analysis: 'AnalysisResult',
+    mapper: OracleMapper,
+    cache: Optional[MappingCache] = None
 ) -> Tuple[List[TableInfo], List[ColumnInfo], List[TableInfo], List[ColumnInfo]]:
-    """분석 결과를 매핑 정보로 변환 (배치 쿼리 최적화)"""
-
-    input_tables = []
-    input_columns = []
-    output_tables = []
-    output_columns = []
+    """분석 결과를 매핑 정보로 변환 (배치 쿼리 최적화, cache 지정 시 캐시에 없는 키만 조회)"""
 
     # 테이블 별칭 → 원본 테이블명 매핑
     alias_to_table = {}
@@ -69,185 +189,120 @@ def process_mapping(
             if t.alias:
                 derived_tables.add(t.alias)
 
+    # 이름/별칭 → (원본 테이블명, Derived 여부, Derived일 때 표시할 별칭)
+    resolve = {}
+    for tbl, original_table in alias_to_table.items():
+        if tbl in derived_tables:
+            resolve[tbl] = (original_table, True, tbl)
+        else:
+            resolve[tbl] = (original_table, original_table in derived_tables, original_table)
+
     # ========================================
     # 1단계: 필요한 모든 (테이블, 컬럼) 쌍 수집
     # ========================================
-    column_requests = []  # [(table, column), ...]
-    table_requests = set()  # {table_name, ...}
-
-    input_derived_set = set()
-    output_derived_set = set()
-
-    # 입력 컬럼 요청 수집
-    input_column_keys = []  # [(original_table, col, is_derived, alias_if_derived), ...]
-    for in_col in analysis.input_columns:
-        tbl = in_col.table
-        col = in_col.column
-        original_table = alias_to_table.get(tbl, tbl)
-        is_derived = in_col.is_derived or tbl in derived_tables or original_table in derived_tables
-
-        if is_derived:
-            alias = tbl if tbl in derived_tables else original_table
-            input_column_keys.append((original_table, col, True, alias))
-            input_derived_set.add(alias)
-        else:
-            input_column_keys.append((original_table, col, False, None))
-            column_requests.append((original_table, col))
-            table_requests.add(original_table)
+    # 키는 처음부터 대문자로 (배치 조회/캐시 키 규칙과 동일)
+    column_requests = set()  # {(TABLE, COLUMN), ...}
+    table_requests = set()  # {TABLE, ...}
 
-    # 출력 컬럼 요청 수집
-    output_column_keys = []
-    star_column_tables = []  # SELECT * 처리용: [(original_table, is_derived, alias), ...]
-
-    for out_col in analysis.output_columns:
-        tbl = out_col.table
-        col = out_col.column
-        original_table = alias_to_table.get(tbl, tbl)
-        is_derived = out_col.is_derived or tbl in derived_tables or original_table in derived_tables
-
-        if is_derived:
-            alias = tbl if tbl in derived_tables else original_table
-            output_column_keys.append((original_table, col, True, alias))
-            output_derived_set.add(alias)
-        elif col == '*':
-            # SELECT * 컬럼은 별도 처리 (해당 테이블의 모든 컬럼 조회 필요)
-            star_column_tables.append((original_table, False, None))
-            table_requests.add(original_table)
-        else:
-            output_column_keys.append((original_table, col, False, None))
-            column_requests.append((original_table, col))
-            table_requests.add(original_table)
+    input_column_keys, input_derived_set = _collect_column_keys(
+        analysis.input_columns, resolve, column_requests, table_requests
+    )
+    star_tables = []  # SELECT * 처리용: [original_table, ...]
+    output_column_keys, output_derived_set = _collect_column_keys(
+        analysis.output_columns, resolve, column_requests, table_requests, star_tables
+    )
 
     # ========================================
-    # 2단계: 배치 쿼리 실행 (1-2회 SQLcl 호출)
+    # 2단계: 배치 쿼리 실행 (1회 SQLcl 호출)
     # ========================================
-    # 중복 제거
-    unique_column_requests = list(set(column_requests))
-    unique_table_requests = list(table_requests)
+    # 디스크 캐시에 있는 항목은 제외하고 나머지만 배치 조회
+    star_requests = set(star_tables)
+    column_cache, table_cache, star_cache = {}, {}, {}
+    if cache is not None:
+        try:
+            column_cache, column_misses = cache.get_columns(column_requests)
+            table_cache, table_misses = cache.get_tables(table_requests)
+            star_cache, star_misses = cache.get_star_columns(star_requests)
+        except sqlite3.Error as e:
+            # 캐시를 읽을 수 없으면 이번 실행은 캐시 없이 전부 조회
+            print(f"  ! 매핑 캐시 조회 실패 (캐시 없이 진행): {e}")
+            column_cache, table_cache, star_cache = {}, {}, {}
+            cache = None
+        else:
+            column_requests, table_requests, star_requests = column_misses, table_misses, star_misses
 
-    # 배치 조회
-    column_cache = mapper.get_columns_batch(unique_column_requests)
-    table_cache = mapper.get_tables_batch(unique_table_requests)
+    # 컬럼/테이블 + SELECT * 테이블의 전체 컬럼 배치 조회
+    try:
+        fetched_columns, fetched_tables, all_columns_map = mapper.get_mappings_batch(
+            column_requests, table_requests, star_requests
+        )
+    except OracleQueryError as e:
+        # 이번 실행만 매핑없음으로 처리하고, 실패한 키는 캐시에 저장하지 않음 (다음 실행에서 재조회)
+        print(f"  ! 매핑 조회 실패 (캐시에 저장하지 않음): {e}")
+        fetched_columns, fetched_tables = {}, {}
+        all_columns_map = {table_name: [] for table_name in star_requests}
+    else:
+        if cache is not None:
+            try:
+                cache.put_columns(column_requests, fetched_columns)
+                cache.put_tables(table_requests, fetched_tables)
+                cache.put_star_columns(star_requests, all_columns_map)
+            except sqlite3.Error as e:
+                # 저장 실패(DB 잠김 등)는 이번 결과에 영향 없음 - 다음 실행에서 다시 조회
+                print(f"  ! 매핑 캐시 저장 실패: {e}")
+    column_cache.update(fetched_columns)
+    table_cache.update(fetched_tables)
+    all_columns_map.update(star_cache)
 
     # ========================================
     # 3단계: 캐시에서 결과 조회하여 ColumnInfo 생성
     # ========================================
 
-    # 입력 컬럼 처리
+    # 입력 컬럼/테이블 처리
+    input_columns_map = {}  # {(table_eng, col_eng): ColumnInfo} 중복 제거 + 순서 유지
     input_table_set = set()
-    for original_table, col, is_derived, alias in input_column_keys:
-        if is_derived:
-            col_info = mapper.create_derived_column_info(alias, col)
-        else:
-            # 캐시에서 조회 (키는 대문자)
-            key = (original_table.upper(), col.upper())
-            col_info = column_cache.get(key)
-            if not col_info:
-                col_info = mapper.create_unmapped_column_info(original_table, col)
-            input_table_set.add(original_table)
-
-        # 중복 체크 후 추가
-        exists = any(
-            c.table_eng == col_info.table_eng and c.col_eng == col_info.col_eng
-            for c in input_columns
-        )
-        if not exists:
-            input_columns.append(col_info)
-
-    # 입력 테이블 정보 추가
-    for table_name in input_table_set:
-        key = table_name.upper()
-        table_info = table_cache.get(key)
-        if not table_info:
-            table_info = mapper.create_unmapped_table_info(table_name)
-        input_tables.append(table_info)
-
-    # Derived Table 정보 추가
-    for alias in input_derived_set:
-        input_tables.append(mapper.create_derived_table_info(alias))
+    _append_column_infos(input_column_keys, mapper, column_cache, input_columns_map, input_table_set)
+    input_tables = _build_table_infos(input_table_set, input_derived_set, mapper, table_cache)
 
     # 출력 컬럼 처리
+    output_columns_map = {}  # {(table_eng, col_eng): ColumnInfo} 중복 제거 + 순서 유지
     output_table_set = set()
 
-    # SELECT * 컬럼 확장 처리
-    for original_table, is_derived, alias in star_column_tables:
-        if is_derived:
-            # Derived 테이블의 *는 그대로 처리
-            col_info = mapper.create_derived_column_info(alias, '*')
-            output_columns.append(col_info)
-        else:
-            # 일반 테이블: 해당 테이블의 모든 컬럼 조회
-            all_cols = mapper.get_all_columns_for_table(original_table)
-            if all_cols:
-                for col_info in all_cols:
-                    # 중복 체크 후 추가
-                    exists = any(
-                        c.table_eng == col_info.table_eng and c.col_eng == col_info.col_eng
-                        for c in output_columns
-                    )
-                    if not exists:
-                        output_columns.append(col_info)
-                output_table_set.add(original_table)
-            else:
-                # 매핑 테이블에 없으면 [매핑없음] *로 추가
-                col_info = mapper.create_unmapped_column_info(original_table, '*')
-                output_columns.append(col_info)
-                output_table_set.add(original_table)
+    # SELECT * 컬럼 확장 처리: 해당 테이블의 모든 컬럼
+    for original_table in star_tables:
+        all_cols = all_columns_map[original_table]
+        if not all_cols:
+            # 매핑 테이블에 없으면 [매핑없음] *로 추가
+            all_cols = [mapper.create_unmapped_column_info(original_table, '*')]
+        for col_info in all_cols:
+            output_columns_map.setdefault((col_info.table_eng, col_info.col_eng), col_info)
+        output_table_set.add(original_table)
 
     # 개별 컬럼 처리
-    for original_table, col, is_derived, alias in output_column_keys:
-        if is_derived:
-            col_info = mapper.create_derived_column_info(alias, col)
-        else:
-            key = (original_table.upper(), col.upper())
-            col_info = column_cache.get(key)
-            if not col_info:
-                col_info = mapper.create_unmapped_column_info(original_table, col)
-            output_table_set.add(original_table)
-
-        # 중복 체크 후 추가
-        exists = any(
-            c.table_eng == col_info.table_eng and c.col_eng == col_info.col_eng
-            for c in output_columns
-        )
-        if not exists:
-            output_columns.append(col_info)
-
-    # 출력 테이블 정보 추가
-    for table_name in output_table_set:
-        key = table_name.upper()
-        table_info = table_cache.get(key)
-        if not table_info:
-            table_info = mapper.create_unmapped_table_info(table_name)
-        output_tables.append(table_info)
-
-    # Derived Table 정보 추가
-    for alias in output_derived_set:
-        output_tables.append(mapper.create_derived_table_info(alias))
+    _append_column_infos(output_column_keys, mapper, column_cache, output_columns_map, output_table_set)
+    output_tables = _build_table_infos(output_table_set, output_derived_set, mapper, table_cache)
 
-    return input_tables, input_columns, output_tables, output_columns
+    return input_tables, list(input_columns_map.values()), output_tables, list(output_columns_map.values())
 
 
-def run(input_file: str, output_file: str, proc_name_arg: Optional[str] = None):
-    """메인 실행
+def load_procedure(
+    input_file: Optional[str],
+    proc_name_arg: Optional[str] = None,
+    mssql: Optional['MSSQLReader'] = None
+) -> Tuple[str, str]:
+    """[1/5] 프로시저 본문 가져오기 (DB 조회 또는 파일 읽기, 주석 제거)
 
-    Args:
-        input_file: 입력 파일 경로 (기본 방식)
-        output_file: 출력 파일 경로
-        proc_name_arg: 프로시저 이름 (DB 조회 방식)
+    Returns:
+        (프로시저 이름, 주석 제거한 본문)
     """
-    total_start = time.time()
-    step_times = {}
-
-    print(f"=== 프로시저 매핑 도구 ===")
-
-    # 1. 프로시저 본문 가져오기
-    step_start = time.time()
-
     if proc_name_arg:
         # DB에서 프로시저 본문 조회
         print(f"[1/5] MSSQL에서 프로시저 조회: {proc_name_arg}")
-        procedure_text = get_procedure_from_db(proc_name_arg)
+        if mssql is not None:
+            procedure_text = mssql.get_procedure_definition(proc_name_arg)
+        else:
+            from .mssql_reader import get_procedure_from_db
+            procedure_text = get_procedure_from_db(proc_name_arg)
         if not procedure_text:
             raise ValueError(f"프로시저 '{proc_name_arg}'을(를) DB에서 찾을 수 없습니다.")
         proc_name = proc_name_arg
@@ -271,6 +326,47 @@ def run(input_file: str, output_file: str, proc_name_arg: Optional[str] = None):
             print("  - 프로시저 이름: (추출 실패)")
             proc_name = "Unknown"
 
+    return proc_name, procedure_text
+
+
+def run(
+    input_file: str,
+    output_file: str,
+    proc_name_arg: Optional[str] = None,
+    refresh_cache: bool = False,
+    *,
+    mapper: Optional[OracleMapper] = None,
+    mssql: Optional['MSSQLReader'] = None,
+    wait_excel: bool = True,
+    procedure: Optional[Tuple[str, str]] = None,
+    analysis: Optional['AnalysisResult'] = None
+) -> Optional[Future]:
+    """메인 실행
+
+    Args:
+        input_file: 입력 파일 경로 (기본 방식)
+        output_file: 출력 파일 경로
+        proc_name_arg: 프로시저 이름 (DB 조회 방식)
+        refresh_cache: True면 매핑 캐시를 비우고 Oracle에서 다시 조회
+        mapper: 재사용할 OracleMapper (없으면 이번 실행 동안 새로 생성)
+        mssql: 재사용할 MSSQLReader (없으면 조회 시 새로 연결)
+        wait_excel: False면 Excel 저장 완료를 기다리지 않고 Future 반환 (다음 프로시저 처리와 겹쳐 실행)
+        procedure: 이미 가져온 (프로시저 이름, 본문) - 지정 시 1단계 생략
+        analysis: 이미 분석한 결과 (run_batch의 병렬 분석) - 지정 시 Gemini 호출 생략
+
+    Returns:
+        wait_excel=False일 때 Excel 저장 Future (호출한 쪽에서 result()로 완료 대기), 그 외 None
+    """
+    total_start = time.time()
+    step_times = {}
+
+    print(f"=== 프로시저 매핑 도구 ===")
+
+    # 1. 프로시저 본문 가져오기
+    step_start = time.time()
+    if procedure is None:
+        procedure = load_procedure(input_file, proc_name_arg, mssql)
+    proc_name, procedure_text = procedure
     step_times['1_입력처리'] = time.time() - step_start
 
     # 출력 경로 설정 (output/excel, output/csv)
@@ -288,60 +384,82 @@ def run(input_file: str, output_file: str, proc_name_arg: Optional[str] = None):
 
     # 2. Gemini API로 분석
     step_start = time.time()
-    print("[2/5] Gemini API로 프로시저 분석 중...")
-    analyzer = GeminiAnalyzer()
-    analysis = analyzer.analyze(procedure_text)
-    step_times['2_Gemini분석'] = time.time() - step_start
-    print(f"  - 응답 시간: {analysis.response_time:.2f}초")
-    print(f"  - 발견된 테이블: {len(analysis.tables)}개")
-    print(f"  - 발견된 파라미터: {[p.get('name', p) if isinstance(p, dict) else p for p in analysis.parameters]}")
-    print(f"  - 입력 컬럼 (WHERE): {len(analysis.input_columns)}개")
-    print(f"  - 출력 컬럼 (SELECT): {len(analysis.output_columns)}개")
-    for t in analysis.tables:
-        print(f"    > {t.name} ({t.alias})")
-
-    # 3. Description 출력
-    print("[3/5] 프로시저 설명:")
-    if analysis.description:
-        print(f"  {analysis.description[:200]}..." if len(analysis.description) > 200 else f"  {analysis.description}")
-    else:
-        print("  (설명 없음)")
-
-    # 4. Oracle DB에서 매핑 조회
-    step_start = time.time()
-    print("[4/5] Oracle DB에서 매핑 정보 조회 중...")
-    with OracleMapper() as mapper:
+    print("[2/5] Gemini API로 프로시저 분석 중..." if analysis is None else "[2/5] Gemini 분석 결과 사용 (일괄 분석)")
+    # Oracle 연결은 분석 결과와 무관하므로 분석 동안 백그라운드에서 준비
+    mapper_future = None
+    if mapper is None:
+        mapper_future = _MAPPER_EXECUTOR.submit(OracleMapper().__enter__)
+    with ExitStack() as stack:
+        if mapper_future is not None:
+            # 백그라운드에서 연결한 mapper는 어느 단계에서 실패하든 블록을 벗어날 때 종료
+            stack.callback(_close_background_mapper, mapper_future)
+
+        if analysis is None:
+            from .gemini_analyzer import GeminiAnalyzer
+            analyzer = GeminiAnalyzer()
+            analysis = analyzer.analyze(procedure_text)
+        step_times['2_Gemini분석'] = time.time() - step_start
+        lines = [
+            f"  - 응답 시간: {analysis.response_time:.2f}초",
+            f"  - 발견된 테이블: {len(analysis.tables)}개",
+            f"  - 발견된 파라미터: {[p.get('name', p) if isinstance(p, dict) else p for p in analysis.parameters]}",
+            f"  - 입력 컬럼 (WHERE): {len(analysis.input_columns)}개",
+            f"  - 출력 컬럼 (SELECT): {len(analysis.output_columns)}개",
+        ]
+        for t in analysis.tables:
+            lines.append(f"    > {t.name} ({t.alias})")
+
+        # 3. Description 출력
+        lines.append("[3/5] 프로시저 설명:")
+        if analysis.description:
+            lines.append(f"  {analysis.description[:200]}..." if len(analysis.description) > 200 else f"  {analysis.description}")
+        else:
+            lines.append("  (설명 없음)")
+        _print_lines(lines)
+
+        # 4. Oracle DB에서 매핑 조회
+        step_start = time.time()
+        print("[4/5] Oracle DB에서 매핑 정보 조회 중...")
+        if mapper_future is not None:
+            # 백그라운드 연결이 실패했으면 여기서 해당 오류를 전달
+            mapper = mapper_future.result()
+        cache = _open_mapping_cache(stack, refresh_cache)
         input_tables, input_columns, output_tables, output_columns = process_mapping(
-            analysis, mapper
+            analysis, mapper, cache
         )
     step_times['4_DB매핑조회'] = time.time() - step_start
 
     # 매핑 통계
-    unmapped_tables = set()
-    for t in input_tables + output_tables:
-        if not t.is_mapped:
-            unmapped_tables.add(t.table_eng)
-    for c in input_columns + output_columns:
-        if not c.is_mapped:
-            unmapped_tables.add(c.table_eng)
-
-    print(f"  - 입력 테이블: {len(set((t.table_eng, t.table_kor) for t in input_tables))}개")
-    print(f"  - 입력 컬럼: {len(input_columns)}개")
-    print(f"  - 출력 테이블: {len(set((t.table_eng, t.table_kor) for t in output_tables))}개")
-    print(f"  - 출력 컬럼: {len(output_columns)}개")
+    unmapped_tables = {
+        x.table_eng
+        for x in chain(input_tables, output_tables, input_columns, output_columns)
+        if not x.is_mapped
+    }
+    input_table_count = len({(t.table_eng, t.table_kor) for t in input_tables})
+    output_table_count = len({(t.table_eng, t.table_kor) for t in output_tables})
+
+    lines = [
+        f"  - 입력 테이블: {input_table_count}개",
+        f"  - 입력 컬럼: {len(input_columns)}개",
+        f"  - 출력 테이블: {output_table_count}개",
+        f"  - 출력 컬럼: {len(output_columns)}개",
+    ]
     if unmapped_tables:
-        print(f"  - 매핑 없는 테이블/뷰: {len(unmapped_tables)}개")
+        lines.append(f"  - 매핑 없는 테이블/뷰: {len(unmapped_tables)}개")
         for t in sorted(unmapped_tables):
-            print(f"    ! {t}")
+            lines.append(f"    ! {t}")
+    _print_lines(lines)
 
     # 5. Excel/CSV 출력
     step_start = time.time()
     print("[5/5] Excel/CSV 파일 생성 중...")
+    from .excel_writer import ExcelWriter
     writer = ExcelWriter()
     writer.create_description_sheet(proc_name, analysis.description, analysis.parameters)
     writer.create_sheet("입력", input_tables, input_columns)
     writer.create_sheet("출력", output_tables, output_columns)
-    writer.save(str(excel_file))
+    # Excel 저장은 백그라운드에서 진행하고 그동안 CSV 작성
+    excel_future = writer.save_async(str(excel_file))
 
     # CSV 출력 (통합)
     writer.save_csv_combined(
@@ -352,21 +470,110 @@ def run(input_file: str, output_file: str, proc_name_arg: Optional[str] = None):
         input_tables, input_columns,
         output_tables, output_columns
     )
+    if wait_excel:
+        excel_future.result()
     step_times['5_파일저장'] = time.time() - step_start
 
     # 총 실행 시간 계산
     total_time = time.time() - total_start
 
-    print()
-    print("=== 완료 ===")
-    print(f"Excel: {excel_file}")
-    print(f"CSV: {csv_file.name}")
-    print()
-    print("=== 실행 시간 ===")
+    lines = [
+        "",
+        "=== 완료 ===",
+        f"Excel: {excel_file}" + ("" if wait_excel else " (백그라운드 저장 중)"),
+        f"CSV: {csv_file.name}",
+        "",
+        "=== 실행 시간 ===",
+    ]
     for step, elapsed in step_times.items():
-        print(f"  {step}: {elapsed:.2f}초")
-    print(f"  ----------------")
-    print(f"  총 실행 시간: {total_time:.2f}초")
+        lines.append(f"  {step}: {elapsed:.2f}초")
+    lines.append("  ----------------")
+    lines.append(f"  총 실행 시간: {total_time:.2f}초")
+    _print_lines(lines)
+    return None if wait_excel else excel_future
+
+
+def run_batch(
+    input_files: List[str] = (),
+    proc_names: List[str] = (),
+    output_file: str = 'output.xlsx',
+    refresh_cache: bool = False
+) -> int:
+    """여러 프로시저 연속 처리 (Oracle/MSSQL 연결을 한 번만 열어 재사용)
+
+    본문을 모두 가져온 뒤 Gemini 분석은 병렬로(analyze_many) 실행하고, 매핑 조회/파일 생성은 프로시저별로 진행
+    프로시저 하나가 실패해도(조회 실패, 분석 오류 등) 오류를 출력하고 나머지를 계속 처리
+
+    Args:
+        input_files: 입력 파일 경로 리스트
+        proc_names: 프로시저 이름 리스트 (DB 조회 방식)
+        output_file: 출력 파일 경로
+        refresh_cache: True면 시작 전에 매핑 캐시를 한 번 비움
+
+    Returns:
+        실패한 프로시저 수
+    """
+    if refresh_cache:
+        with ExitStack() as stack:
+            _open_mapping_cache(stack, refresh=True)
+
+    with ExitStack() as stack:
+        mapper = stack.enter_context(OracleMapper())
+        mssql = None
+        if proc_names:
+            from .mssql_reader import MSSQLReader
+            mssql = stack.enter_context(MSSQLReader())
+
+        jobs = [(input_file, None) for input_file in input_files]
+        jobs += [(None, proc_name) for proc_name in proc_names]
+        failed = []
+
+        # 1단계: 프로시저 본문을 모두 가져옴
+        loaded = []  # [(이름, (프로시저 이름, 본문)), ...]
+        for input_file, proc_name in jobs:
+            try:
+                loaded.append((proc_name or input_file, load_procedure(input_file, proc_name, mssql)))
+            except Exception as e:
+                print(f"오류 ({proc_name or input_file}): {e}")
+                failed.append(proc_name or input_file)
+
+        # 2단계: Gemini 분석은 네트워크 대기가 대부분이므로 API 키별로 나눠 병렬 실행
+        analyses = []
+        if loaded:
+            from .gemini_analyzer import GeminiAnalyzer
+            print(f"\n=== Gemini 일괄 분석: {len(loaded)}개 ===")
+            analyses = GeminiAnalyzer().analyze_many(
+                [procedure_text for _, (_, procedure_text) in loaded],
+                return_exceptions=True
+            )
+
+        # 3~5단계: 매핑 조회/파일 생성은 프로시저별로 진행
+        # Excel 저장은 기다리지 않고 다음 프로시저 처리와 겹쳐 실행, 모든 프로시저 처리 후 한 번에 완료 대기
+        excel_futures = []
+        for (name, procedure), analysis in zip(loaded, analyses):
+            try:
+                if isinstance(analysis, Exception):
+                    raise analysis
+                excel_futures.append((
+                    name,
+                    run(None, output_file, mapper=mapper, wait_excel=False, procedure=procedure, analysis=analysis)
+                ))
+            except Exception as e:
+                print(f"오류 ({name}): {e}")
+                failed.append(name)
+
+    for name, excel_future in excel_futures:
+        try:
+            excel_future.result()
+        except Exception as e:
+            print(f"오류 ({name}): Excel 저장 실패 - {e}")
+            failed.append(name)
+
+    total = len(input_files) + len(proc_names)
+    print(f"\n=== 일괄 처리 완료: {total - len(failed)}/{total}개 성공 ===")
+    for name in failed:
+        print(f"  ! 실패: {name}")
+    return len(failed)
 
 
 def main():
@@ -377,14 +584,14 @@ def main():
 사용 예시:
   python -m mapper.main                           # input.txt에서 읽기
   python -m mapper.main UP_NBOGUN_PlanEduList     # DB에서 프로시저 조회
+  python -m mapper.main UP_A UP_B UP_C            # 여러 프로시저 연속 조회
   python -m mapper.main -i custom.txt             # 지정 파일에서 읽기
 """
     )
     parser.add_argument(
         'proc_name',
-        nargs='?',
-        default=None,
-        help='프로시저 이름 (지정 시 MSSQL DB에서 조회)'
+        nargs='*',
+        help='프로시저 이름 (지정 시 MSSQL DB에서 조회, 여러 개 지정 가능)'
     )
     parser.add_argument(
         '--input', '-i',
@@ -396,11 +603,21 @@ def main():
         default='output.xlsx',
         help='출력 Excel 파일 (기본값: output.xlsx)'
     )
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='매핑 캐시를 무시하고 Oracle에서 다시 조회'
+    )
 
     args = parser.parse_args()
 
     try:
-        run(args.input, args.output, args.proc_name)
+        if len(args.proc_name) > 1:
+            if run_batch(proc_names=args.proc_name, output_file=args.output, refresh_cache=args.refresh_cache):
+                sys.exit(1)
+        else:
+            proc_name = args.proc_name[0] if args.proc_name else None
+            run(args.input, args.output, proc_name, args.refresh_cache)
     except FileNotFoundError as e:
         print(f"오류: {e}")
         sys.exit(1)
@@ -0,0 +1,204 @@
+"""
+Oracle 매핑 조회 결과 디스크 캐시 (SQLite)
+"""
+import json
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .oracle_mapper import ColumnInfo, TableInfo
+
+# 캐시 DB 경로
+MAPPING_CACHE_DB = Path(__file__).parent.parent / ".mapping_cache" / "mappings.db"
+
+# 캐시 유효 시간 (초) - 매핑 테이블 변경 반영 주기
+MAPPING_CACHE_TTL = 24 * 60 * 60
+
+
+class MappingCache:
+    """(테이블, 컬럼) / 테이블 / SELECT * 테이블 전체 컬럼 매핑 결과를 실행 간에 재사용하는 캐시
+
+    매핑이 없는 키도 payload NULL(전체 컬럼은 빈 목록)로 저장하여 다음 실행에서 재조회하지 않음
+    """
+
+    def __init__(self, db_path: Path = MAPPING_CACHE_DB, ttl: int = MAPPING_CACHE_TTL):
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self.conn = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def connect(self):
+        """캐시 DB 연결 (없으면 생성)
+
+        Raises:
+            OSError, sqlite3.Error: 캐시 디렉토리 생성 실패, DB 잠김/손상 (연결은 닫은 뒤 전달)
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        try:
+            self._create_tables()
+        except sqlite3.Error:
+            self.close()
+            raise
+
+    def _create_tables(self):
+        """캐시 테이블 생성 (이미 있으면 유지)"""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS column_map (
+                table_up TEXT NOT NULL,
+                col_up TEXT NOT NULL,
+                payload TEXT,
+                ts INTEGER NOT NULL,
+                PRIMARY KEY (table_up, col_up)
+            );
+            CREATE TABLE IF NOT EXISTS table_map (
+                table_up TEXT NOT NULL PRIMARY KEY,
+                payload TEXT,
+                ts INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS star_columns (
+                table_up TEXT NOT NULL PRIMARY KEY,
+                payload TEXT NOT NULL,
+                ts INTEGER NOT NULL
+            );
+        """)
+
+    def close(self):
+        """연결 종료"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def clear(self):
+        """캐시 전체 삭제 (--refresh-cache)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM column_map")
+            self.conn.execute("DELETE FROM table_map")
+            self.conn.execute("DELETE FROM star_columns")
+
+    def get_columns(
+        self,
+        column_requests: Iterable[Tuple[str, str]]
+    ) -> Tuple[Dict[Tuple[str, str], ColumnInfo], List[Tuple[str, str]]]:
+        """
+        컬럼 매핑 캐시 조회
+
+        Args:
+            column_requests: [(old_table, old_column), ...]
+
+        Returns:
+            ({(upper(old_table), upper(old_column)): ColumnInfo}, 캐시에 없는 요청 리스트)
+        """
+        min_ts = int(time.time()) - self.ttl
+        hits = {}
+        misses = []
+        for old_table, old_column in column_requests:
+            key = (old_table.upper(), old_column.upper())
+            row = self.conn.execute(
+                "SELECT payload FROM column_map WHERE table_up = ? AND col_up = ? AND ts >= ?",
+                (*key, min_ts)
+            ).fetchone()
+            if row is None:
+                misses.append((old_table, old_column))
+            elif row[0] is not None:
+                hits[key] = ColumnInfo(**json.loads(row[0]))
+        return hits, misses
+
+    def put_columns(
+        self,
+        column_requests: Iterable[Tuple[str, str]],
+        result: Dict[Tuple[str, str], ColumnInfo]
+    ):
+        """배치 조회한 요청과 결과를 캐시에 저장 (결과 없는 요청은 NULL)"""
+        ts = int(time.time())
+        rows = []
+        for old_table, old_column in column_requests:
+            key = (old_table.upper(), old_column.upper())
+            info = result.get(key)
+            payload = json.dumps(asdict(info), ensure_ascii=False) if info else None
+            rows.append((*key, payload, ts))
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO column_map VALUES (?, ?, ?, ?)", rows)
+
+    def get_tables(self, table_names: Iterable[str]) -> Tuple[Dict[str, TableInfo], List[str]]:
+        """
+        테이블 매핑 캐시 조회
+
+        Args:
+            table_names: [old_table_name, ...]
+
+        Returns:
+            ({upper(old_table_name): TableInfo}, 캐시에 없는 테이블 리스트)
+        """
+        min_ts = int(time.time()) - self.ttl
+        hits = {}
+        misses = []
+        for table_name in table_names:
+            key = table_name.upper()
+            row = self.conn.execute(
+                "SELECT payload FROM table_map WHERE table_up = ? AND ts >= ?",
+                (key, min_ts)
+            ).fetchone()
+            if row is None:
+                misses.append(table_name)
+            elif row[0] is not None:
+                hits[key] = TableInfo(**json.loads(row[0]))
+        return hits, misses
+
+    def put_tables(self, table_names: Iterable[str], result: Dict[str, TableInfo]):
+        """배치 조회한 테이블과 결과를 캐시에 저장 (결과 없는 테이블은 NULL)"""
+        ts = int(time.time())
+        rows = []
+        for table_name in table_names:
+            key = table_name.upper()
+            info = result.get(key)
+            payload = json.dumps(asdict(info), ensure_ascii=False) if info else None
+            rows.append((key, payload, ts))
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO table_map VALUES (?, ?, ?)", rows)
+
+    def get_star_columns(self, table_names: Iterable[str]) -> Tuple[Dict[str, List[ColumnInfo]], List[str]]:
+        """
+        SELECT * 테이블의 전체 컬럼 캐시 조회
+
+        Args:
+            table_names: [old_table_name, ...]
+
+        Returns:
+            ({old_table_name(요청한 그대로): [ColumnInfo, ...]}, 캐시에 없는 테이블 리스트)
+        """
+        min_ts = int(time.time()) - self.ttl
+        hits = {}
+        misses = []
+        for table_name in table_names:
+            row = self.conn.execute(
+                "SELECT payload FROM star_columns WHERE table_up = ? AND ts >= ?",
+                (table_name.upper(), min_ts)
+            ).fetchone()
+            if row is None:
+                misses.append(table_name)
+            else:
+                # old_table_eng는 요청한 테이블명 그대로 (OracleMapper.get_all_columns_for_tables와 동일)
+                hits[table_name] = [
+                    ColumnInfo(**{**data, "old_table_eng": table_name})
+                    for data in json.loads(row[0])
+                ]
+        return hits, misses
+
+    def put_star_columns(self, table_names: Iterable[str], result: Dict[str, List[ColumnInfo]]):
+        """배치 조회한 SELECT * 테이블의 전체 컬럼을 캐시에 저장 (매핑 없는 테이블은 빈 목록)"""
+        ts = int(time.time())
+        rows = []
+        for table_name in table_names:
+            payload = json.dumps([asdict(info) for info in result.get(table_name, [])], ensure_ascii=False)
+            rows.append((table_name.upper(), payload, ts))
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO star_columns VALUES (?, ?, ?)", rows)
@@ -1,10 +1,20 @@
 """
 MSSQL 프로시저 본문 조회 모듈
 """
-import pymssql
 from typing import Optional
 from .config import MSSQL_CONFIG
 
+# pyodbc (선택): MSSQL_CONFIG에 "odbc_driver"를 지정한 경우에만 ODBC 드라이버로 조회, 그 외에는 pymssql 사용
+# (pyodbc가 다른 패키지 의존성으로 설치되어 있어도 드라이버가 없을 수 있으므로 설치 여부로 고르지 않음)
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = None
+try:
+    import pymssql
+except ImportError:
+    pymssql = None
+
 
 class MSSQLReader:
     """MSSQL에서 프로시저 본문을 조회하는 클래스"""
@@ -12,6 +22,10 @@ class MSSQLReader:
     def __init__(self):
         self.config = MSSQL_CONFIG
         self.conn = None
+        self._cursor = None
+        self._use_odbc = bool(self.config.get("odbc_driver"))
+        # 파라미터 표기 (pyodbc: ?, pymssql: %s)
+        self._param = "?" if self._use_odbc else "%s"
 
     def __enter__(self):
         self.connect()
@@ -22,19 +36,44 @@ class MSSQLReader:
 
     def connect(self):
         """MSSQL 연결"""
-        self.conn = pymssql.connect(
-            server=self.config["host"],
-            port=self.config["port"],
-            user=self.config["user"],
-            password=self.config["password"],
-            database=self.config["database"]
-        )
+        if self._use_odbc:
+            if pyodbc is None:
+                raise ImportError("MSSQL_CONFIG에 odbc_driver가 지정되어 있지만 pyodbc가 설치되어 있지 않습니다.")
+            password = self.config["password"].replace("}", "}}")
+            conn_str = (
+                f"DRIVER={{{self.config['odbc_driver']}}};"
+                f"SERVER={self.config['host']},{self.config['port']};"
+                f"DATABASE={self.config['database']};"
+                f"UID={self.config['user']};PWD={{{password}}}"
+            )
+            # ODBC Driver 18은 기본이 Encrypt=yes + 인증서 검증 (자체 서명 인증서 서버는 설정 필요)
+            if "encrypt" in self.config:
+                conn_str += f";Encrypt={self.config['encrypt']}"
+            if "trust_server_certificate" in self.config:
+                conn_str += f";TrustServerCertificate={self.config['trust_server_certificate']}"
+            self.conn = pyodbc.connect(conn_str)
+        else:
+            if pymssql is None:
+                raise ImportError("pymssql이 설치되어 있지 않습니다. (pyodbc 사용 시 MSSQL_CONFIG에 odbc_driver 지정)")
+            self.conn = pymssql.connect(
+                server=self.config["host"],
+                port=self.config["port"],
+                user=self.config["user"],
+                password=self.config["password"],
+                database=self.config["database"]
+            )
+        # 조회마다 커서를 새로 만들지 않고 연결 동안 재사용
+        self._cursor = self.conn.cursor()
+        if self._use_odbc:
+            # 파라미터(프로시저 이름)를 sysname 타입으로 고정하여 서버의 실행 계획 재사용
+            self._cursor.setinputsizes([(pyodbc.SQL_WVARCHAR, 128, 0)])
 
     def close(self):
         """연결 종료"""
         if self.conn:
             self.conn.close()
             self.conn = None
+            self._cursor = None
 
     def get_procedure_definition(self, proc_name: str) -> Optional[str]:
         """
@@ -47,13 +86,13 @@ class MSSQLReader:
             프로시저 본문 (CREATE PROC ... 전체)
             없으면 None
         """
-        cursor = self.conn.cursor()
+        cursor = self._cursor
 
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT m.definition
             FROM sys.procedures p
             JOIN sys.sql_modules m ON p.object_id = m.object_id
-            WHERE p.name = %s
+            WHERE p.name = {self._param}
         """, (proc_name,))
 
         row = cursor.fetchone()
@@ -61,12 +100,12 @@ class MSSQLReader:
 
     def procedure_exists(self, proc_name: str) -> bool:
         """프로시저 존재 여부 확인"""
-        cursor = self.conn.cursor()
+        cursor = self._cursor
 
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT COUNT(*)
             FROM sys.procedures
-            WHERE name = %s
+            WHERE name = {self._param}
         """, (proc_name,))
 
         row = cursor.fetchone()
@@ -97,8 +136,9 @@ if __name__ == "__main__":
     print("-" * 50)
 
     with MSSQLReader() as reader:
-        if reader.procedure_exists(proc_name):
-            definition = reader.get_procedure_definition(proc_name)
+        # 없으면 None이 반환되므로 존재 여부 확인 쿼리는 따로 보내지 않음
+        definition = reader.get_procedure_definition(proc_name)
+        if definition is not None:
             print(f"본문 길이: {len(definition)} 자")
             print("-" * 50)
             print(definition[:1000])
@@ -1,10 +1,72 @@
+import re
+import time
+import queue
+import threading
 import subprocess
-from typing import Optional, List, Dict, Tuple
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional, List, Dict, Tuple
+from dataclasses import dataclass, field
 from .config import ORACLE_CONFIG, MAPPING_TABLE, COLUMN_MAPPING
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _load_oracledb():
+    """oracledb (선택): 설치되어 있으면 세션 풀로 직접 조회, 없으면(None) SQLcl 프로세스로 조회
+
+    import 비용(cryptography 등)이 커서 모듈 로드 시점이 아닌 첫 연결/조회 시점에 한 번만 import
+    """
+    try:
+        import oracledb
+    except ImportError:
+        return None
+    return oracledb
+
+
+# oracledb 세션 풀 크기 (get_mappings_batch의 컬럼/테이블/전체 컬럼 쿼리를 동시에 실행할 수 있도록 최소 3)
+ORACLE_POOL_MIN = 3
+ORACLE_POOL_MAX = 4
+
+# oracledb 쿼리 동시 실행용 스레드 풀 (쿼리마다 풀에서 연결을 따로 받음)
+_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=ORACLE_POOL_MAX)
+
+# IN 절 최대 항목 수 (Oracle ORA-01795 제한) - 넘으면 쿼리를 나눠서 조회
+ORACLE_IN_LIST_LIMIT = 1000
+
+# SQLcl 세션 시작 시 한 번만 보내는 출력 설정
+SQLCL_PRELUDE = """SET HEADING OFF
+SET FEEDBACK OFF
+SET PAGESIZE 0
+SET LINESIZE 32767
+SET TRIMSPOOL ON
+SET TRIMOUT ON
+"""
+
+# SQLcl 쿼리 결과 끝 표시 (쿼리 뒤에 PROMPT로 출력하여 결과 경계 구분)
+SQLCL_END_MARKER = "__MAPPER_QUERY_END__"
+
+# SQLcl 쿼리 1회 최대 대기 시간 (초)
+SQLCL_TIMEOUT = 30
+
+# 바인드 변수 (:name) 패턴 - SQLcl 실행 시 리터럴로 치환
+BIND_RE = re.compile(r":(\w+)")
+
+# SQLcl 오류 메시지 (ORA-00942, SP2-0734 등) - 결과 행(구분자 포함)이 아닌 줄에서만 검사
+SQLCL_ERROR_RE = re.compile(r"\b(?:ORA|SP2)-\d{4,5}\b")
+
+
+class OracleQueryError(Exception):
+    """매핑 조회 실패 (SQLcl 타임아웃/종료/오류, oracledb 오류) - 조회 결과 없음과 구분"""
+
+
+def _pump_lines(stream, lines: queue.Queue):
+    """SQLcl 출력을 한 줄씩 큐로 전달 (프로세스 종료 시 None)"""
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+@dataclass(slots=True, frozen=True)
 class ColumnInfo:
     """컬럼 매핑 정보"""
     table_kor: str
@@ -19,7 +81,7 @@ class ColumnInfo:
     is_mapped: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TableInfo:
     """테이블 매핑 정보"""
     table_kor: str
@@ -27,83 +89,258 @@ class TableInfo:
     is_mapped: bool = True
 
 
+@dataclass
+class _Query:
+    """조회 쿼리 (SELECT 필드 목록 + FROM 이하, 바인드 변수)"""
+    fields: List[str]
+    tail: str
+    binds: Dict[str, str] = field(default_factory=dict)
+    distinct: bool = False
+
+
 class OracleMapper:
-    """SQLcl을 사용하여 Oracle DB에서 매핑 정보를 조회하는 클래스"""
+    """Oracle DB에서 매핑 정보를 조회하는 클래스 (oracledb 세션 풀, 없으면 SQLcl)"""
 
-    DELIMITER = '|||'  # 구분자 (파이프 3개로 충돌 방지)
+    DELIMITER = '|||'  # SQLcl 출력 구분자 (파이프 3개로 충돌 방지)
 
     def __init__(self):
         self.sqlcl_path = "/home/ajh428/sqlcl/bin/sql"
         self.conn_string = f"{ORACLE_CONFIG['user']}/{ORACLE_CONFIG['password']}@{ORACLE_CONFIG['host']}:{ORACLE_CONFIG['port']}/{ORACLE_CONFIG['sid']}"
+        self._pool = None
+        # oracledb 미설치 시 연결 동안 유지하는 SQLcl 프로세스 (JVM 기동은 한 번만)
+        self._sqlcl = None
+        self._sqlcl_lines = None
+        self._sqlcl_lock = threading.Lock()
+        # 단건 조회 결과 캐시 (대문자 키, 매핑 없음은 None으로 저장하여 재조회 방지)
+        self._table_info_cache: Dict[str, Optional[TableInfo]] = {}
+        self._column_info_cache: Dict[Tuple[str, str], Optional[ColumnInfo]] = {}
 
     def connect(self):
-        pass
+        """oracledb 세션 풀 생성 (oracledb 미설치 시 SQLcl 프로세스 시작)"""
+        oracledb = _load_oracledb()
+        if oracledb is None:
+            with self._sqlcl_lock:
+                if self._sqlcl is None:
+                    self._start_sqlcl()
+            return
+        if self._pool is not None:
+            return
+        self._pool = oracledb.create_pool(
+            user=ORACLE_CONFIG['user'],
+            password=ORACLE_CONFIG['password'],
+            dsn=f"{ORACLE_CONFIG['host']}:{ORACLE_CONFIG['port']}/{ORACLE_CONFIG['sid']}",
+            min=ORACLE_POOL_MIN,
+            max=ORACLE_POOL_MAX,
+            increment=1
+        )
 
     def disconnect(self):
-        pass
+        """세션 풀 / SQLcl 프로세스 종료"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        with self._sqlcl_lock:
+            self._stop_sqlcl()
 
     def __enter__(self):
+        self.connect()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        self.disconnect()
+
+    def _start_sqlcl(self):
+        """SQLcl 프로세스 시작 후 출력 설정 전송"""
+        proc = subprocess.Popen(
+            [self.sqlcl_path, "-S", self.conn_string],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        lines = queue.Queue()
+        threading.Thread(target=_pump_lines, args=(proc.stdout, lines), daemon=True).start()
+        proc.stdin.write(SQLCL_PRELUDE)
+        proc.stdin.flush()
+        self._sqlcl, self._sqlcl_lines = proc, lines
+
+    def _stop_sqlcl(self, kill: bool = False):
+        """SQLcl 프로세스 종료 (kill이면 응답을 기다리지 않고 강제 종료)"""
+        proc, self._sqlcl, self._sqlcl_lines = self._sqlcl, None, None
+        if proc is None:
+            return
+        try:
+            if not kill:
+                proc.stdin.write("EXIT;\n")
+                proc.stdin.close()
+                proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
 
     def _execute_query(self, query: str) -> list:
-        """SQLcl로 쿼리 실행 후 결과 반환"""
-        sql_script = f"""
-SET HEADING OFF
-SET FEEDBACK OFF
-SET PAGESIZE 0
-SET LINESIZE 32767
-SET TRIMSPOOL ON
-SET TRIMOUT ON
-{query}
-EXIT;
-"""
-        try:
-            result = subprocess.run(
-                [self.sqlcl_path, "-S", self.conn_string],
-                input=sql_script,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        """SQLcl로 쿼리 실행 후 결과 반환 (프로세스는 재사용, 결과 끝은 PROMPT 표시로 구분)
+
+        Raises:
+            OracleQueryError: 타임아웃, 프로세스 종료, ORA-/SP2- 오류 출력
+        """
+        output = []
+        with self._sqlcl_lock:
+            try:
+                if self._sqlcl is None:
+                    self._start_sqlcl()
+                self._sqlcl.stdin.write(f"{query}\nPROMPT {SQLCL_END_MARKER}\n")
+                self._sqlcl.stdin.flush()
+
+                deadline = time.monotonic() + SQLCL_TIMEOUT
+                while True:
+                    line = self._sqlcl_lines.get(timeout=max(0, deadline - time.monotonic()))
+                    if line is None:
+                        # 프로세스 종료 (접속 실패 등) - 다음 조회 시 다시 시작
+                        self._stop_sqlcl(kill=True)
+                        raise OracleQueryError(f"SQLcl 오류: {''.join(output).strip()}")
+                    if line.strip() == SQLCL_END_MARKER:
+                        break
+                    output.append(line)
+
+            except queue.Empty:
+                # 응답 대기 중인 프로세스는 재사용할 수 없으므로 종료
+                self._stop_sqlcl(kill=True)
+                raise OracleQueryError("쿼리 타임아웃") from None
+            except OracleQueryError:
+                raise
+            except Exception as e:
+                self._stop_sqlcl(kill=True)
+                raise OracleQueryError(f"쿼리 실행 오류: {e}") from e
+
+        # 쿼리 오류는 프로세스가 계속 살아 있으므로 출력에서 확인
+        errors = [line.strip() for line in output if self.DELIMITER not in line and SQLCL_ERROR_RE.search(line)]
+        if errors:
+            raise OracleQueryError(f"SQLcl 오류: {' / '.join(errors)}")
+
+        # 결과 파싱
+        rows = []
+        for line in output:
+            line = line.strip()
+            if line and not line.startswith('SQL>'):
+                # 구분자로 분리
+                parts = [p.strip() for p in line.split(self.DELIMITER)]
+                rows.append(parts)
+
+        return rows
+
+    def _render_sqlcl(self, query: _Query, tag: str = '') -> str:
+        """SQLcl용 쿼리 문자열 생성 (필드를 구분자로 연결, 바인드 변수는 리터럴로 치환)"""
+        d = self.DELIMITER
+        fields = ([f"'{tag}'"] if tag else []) + query.fields
+        select = f" || '{d}' ||\n                ".join(fields)
+        # SQL Injection 방지: 작은따옴표 이스케이프
+        tail = BIND_RE.sub(lambda m: "'" + query.binds[m.group(1)].replace("'", "''") + "'", query.tail)
+        return f"""
+            SELECT {'DISTINCT ' if query.distinct else ''}
+                {select}
+            {tail};
+        """
 
-            if result.returncode != 0:
-                print(f"SQLcl 오류: {result.stderr}")
-                return []
+    def _run_queries(self, queries: List[_Query]) -> List[list]:
+        """쿼리 여러 개를 한 번에 실행하여 쿼리별 결과 행 리스트 반환
 
-            # 결과 파싱
-            rows = []
-            for line in result.stdout.strip().split('\n'):
-                line = line.strip()
-                if line and not line.startswith('SQL>'):
-                    # 구분자로 분리
-                    parts = [p.strip() for p in line.split(self.DELIMITER)]
-                    rows.append(parts)
+        oracledb: 쿼리마다 풀에서 연결을 받아 바인드 변수로 동시에 실행
+        SQLcl: 하나의 스크립트로 묶어 1회 실행하고 첫 필드(쿼리 번호)로 결과 행을 구분
 
-            return rows
+        Raises:
+            OracleQueryError: 쿼리 중 하나라도 실패 (일부 결과만 반환하지 않음)
+        """
+        oracledb = _load_oracledb()
+        if oracledb is not None:
+            try:
+                self.connect()
+                if len(queries) == 1:
+                    return [self._fetch_rows(queries[0])]
+                return list(_QUERY_EXECUTOR.map(self._fetch_rows, queries))
+            except oracledb.Error as e:
+                raise OracleQueryError(f"쿼리 실행 오류: {e}") from e
+
+        if len(queries) == 1:
+            return [self._execute_query(self._render_sqlcl(queries[0]))]
+
+        script = '\n'.join(self._render_sqlcl(q, str(i)) for i, q in enumerate(queries))
+        results = [[] for _ in queries]
+        for row in self._execute_query(script):
+            if row[0].isdigit() and int(row[0]) < len(queries):
+                results[int(row[0])].append(row[1:])
+        return results
+
+    def _fetch_rows(self, query: _Query) -> list:
+        """oracledb 풀 연결로 쿼리 1개 실행 (값은 SQLcl 출력과 같이 문자열, NULL은 '')"""
+        with self._pool.acquire() as conn, conn.cursor() as cursor:
+            select = ', '.join(query.fields)
+            cursor.execute(
+                f"SELECT {'DISTINCT ' if query.distinct else ''}{select} {query.tail}",
+                query.binds
+            )
+            return [
+                ['' if v is None else str(v) for v in row]
+                for row in cursor
+            ]
+
+    def _run_batched(self, batches: List[Tuple[Callable[[list], _Query], list]]) -> List[list]:
+        """(쿼리 생성 함수, 조회 항목) 목록을 IN 절 제한 단위로 나눠 한 번에 실행
 
-        except subprocess.TimeoutExpired:
-            print("쿼리 타임아웃")
-            return []
-        except Exception as e:
-            print(f"쿼리 실행 오류: {e}")
-            return []
+        Returns:
+            배치별로 합친 결과 행 리스트
+        """
+        queries = []
+        owners = []
+        for index, (build, items) in enumerate(batches):
+            for start in range(0, len(items), ORACLE_IN_LIST_LIMIT):
+                queries.append(build(items[start:start + ORACLE_IN_LIST_LIMIT]))
+                owners.append(index)
+
+        results = [[] for _ in batches]
+        if queries:
+            for index, rows in zip(owners, self._run_queries(queries)):
+                results[index].extend(rows)
+        return results
 
     def get_table_info(self, old_table_name: str) -> Optional[TableInfo]:
-        """기존 테이블명으로 신규 테이블 정보 조회"""
+        """기존 테이블명으로 신규 테이블 정보 조회 (같은 테이블은 한 번만 조회, 조회 실패는 저장하지 않음)"""
+        key = old_table_name.upper()
+        if key not in self._table_info_cache:
+            try:
+                self._table_info_cache[key] = self._fetch_table_info(old_table_name)
+            except OracleQueryError as e:
+                print(e)
+                return None
+        return self._table_info_cache[key]
+
+    def get_column_info(self, old_table_name: str, old_column_name: str) -> Optional[ColumnInfo]:
+        """기존 테이블/컬럼명으로 신규 정보 조회 (같은 컬럼은 한 번만 조회, 조회 실패는 저장하지 않음)"""
+        key = (old_table_name.upper(), old_column_name.upper())
+        if key not in self._column_info_cache:
+            try:
+                self._column_info_cache[key] = self._fetch_column_info(old_table_name, old_column_name)
+            except OracleQueryError as e:
+                print(e)
+                return None
+        return self._column_info_cache[key]
+
+    def _fetch_table_info(self, old_table_name: str) -> Optional[TableInfo]:
+        """기존 테이블명으로 신규 테이블 정보 조회 (조회 실패 시 OracleQueryError)"""
         cm = COLUMN_MAPPING
-        d = self.DELIMITER
-        query = f"""
-            SELECT DISTINCT
-                {cm['new_table_kor']} || '{d}' || {cm['new_table']}
-            FROM {MAPPING_TABLE}
-            WHERE UPPER({cm['old_table']}) = UPPER('{old_table_name}')
-            AND ROWNUM = 1;
-        """
+        query = _Query(
+            fields=[cm['new_table_kor'], cm['new_table']],
+            tail=f"""FROM {MAPPING_TABLE}
+            WHERE UPPER({cm['old_table']}) = UPPER(:old_table)
+            AND ROWNUM = 1""",
+            binds={'old_table': old_table_name},
+            distinct=True
+        )
 
-        rows = self._execute_query(query)
+        rows = self._run_queries([query])[0]
 
         if rows and len(rows[0]) >= 2:
             return TableInfo(
@@ -113,28 +350,29 @@ EXIT;
             )
         return None
 
-    def get_column_info(self, old_table_name: str, old_column_name: str) -> Optional[ColumnInfo]:
-        """기존 테이블/컬럼명으로 신규 정보 조회"""
+    def _fetch_column_info(self, old_table_name: str, old_column_name: str) -> Optional[ColumnInfo]:
+        """기존 테이블/컬럼명으로 신규 정보 조회 (조회 실패 시 OracleQueryError)"""
         cm = COLUMN_MAPPING
-        d = self.DELIMITER
-        query = f"""
-            SELECT
-                {cm['new_table_kor']} || '{d}' ||
-                {cm['new_table']} || '{d}' ||
-                {cm['new_column_kor']} || '{d}' ||
-                {cm['new_column']} || '{d}' ||
-                NVL({cm['data_type']}, ' ') || '{d}' ||
-                NVL(TO_CHAR({cm['length']}), ' ') || '{d}' ||
-                NVL2({cm['pk']}, 'Y', ' ') || '{d}' ||
-                NVL2({cm['fk']}, 'Y', ' ') || '{d}' ||
-                {cm['old_table']}
-            FROM {MAPPING_TABLE}
-            WHERE UPPER({cm['old_table']}) = UPPER('{old_table_name}')
-              AND UPPER({cm['old_column']}) = UPPER('{old_column_name}')
-            AND ROWNUM = 1;
-        """
+        query = _Query(
+            fields=[
+                cm['new_table_kor'],
+                cm['new_table'],
+                cm['new_column_kor'],
+                cm['new_column'],
+                f"NVL({cm['data_type']}, ' ')",
+                f"NVL(TO_CHAR({cm['length']}), ' ')",
+                f"NVL2({cm['pk']}, 'Y', ' ')",
+                f"NVL2({cm['fk']}, 'Y', ' ')",
+                cm['old_table'],
+            ],
+            tail=f"""FROM {MAPPING_TABLE}
+            WHERE UPPER({cm['old_table']}) = UPPER(:old_table)
+              AND UPPER({cm['old_column']}) = UPPER(:old_column)
+            AND ROWNUM = 1""",
+            binds={'old_table': old_table_name, 'old_column': old_column_name}
+        )
 
-        rows = self._execute_query(query)
+        rows = self._run_queries([query])[0]
 
         if rows and len(rows[0]) >= 9:
             return ColumnInfo(
@@ -151,51 +389,66 @@ EXIT;
             )
         return None
 
-    def get_columns_batch(self, column_requests: List[Tuple[str, str]]) -> Dict[Tuple[str, str], ColumnInfo]:
-        """여러 (테이블, 컬럼) 쌍을 한번에 조회 (배치 쿼리)
-
-        Args:
-            column_requests: [(old_table, old_column), ...] 리스트
-
-        Returns:
-            {(upper(old_table), upper(old_column)): ColumnInfo} 딕셔너리
-        """
-        if not column_requests:
-            return {}
-
+    @staticmethod
+    def _table_in_clause(table_names: List[str], binds: Dict[str, str]) -> str:
+        """테이블명 IN 절 생성 (:n0, :n1, ...) 및 바인드 값 등록"""
+        items = []
+        for i, table_name in enumerate(table_names):
+            binds[f"n{i}"] = table_name.upper()
+            items.append(f":n{i}")
+        return ', '.join(items)
+
+    def _columns_batch_query(self, column_requests: List[Tuple[str, str]]) -> _Query:
+        """(테이블, 컬럼) 배치 조회 쿼리 생성"""
         cm = COLUMN_MAPPING
-        d = self.DELIMITER
 
-        # IN 절 생성: (('TABLE1', 'COL1'), ('TABLE2', 'COL2'), ...)
+        # IN 절 생성: ((:t0, :c0), (:t1, :c1), ...)
+        binds = {}
         in_clause_items = []
-        for old_table, old_column in column_requests:
-            # SQL Injection 방지: 작은따옴표 이스케이프
-            safe_table = old_table.replace("'", "''")
-            safe_column = old_column.replace("'", "''")
-            in_clause_items.append(f"('{safe_table.upper()}', '{safe_column.upper()}')")
+        for i, (old_table, old_column) in enumerate(column_requests):
+            binds[f"t{i}"] = old_table.upper()
+            binds[f"c{i}"] = old_column.upper()
+            in_clause_items.append(f"(:t{i}, :c{i})")
 
         in_clause = ',\n            '.join(in_clause_items)
 
-        query = f"""
-            SELECT
-                {cm['old_table']} || '{d}' ||
-                {cm['old_column']} || '{d}' ||
-                {cm['new_table_kor']} || '{d}' ||
-                {cm['new_table']} || '{d}' ||
-                {cm['new_column_kor']} || '{d}' ||
-                {cm['new_column']} || '{d}' ||
-                NVL({cm['data_type']}, ' ') || '{d}' ||
-                NVL(TO_CHAR({cm['length']}), ' ') || '{d}' ||
-                NVL2({cm['pk']}, 'Y', ' ') || '{d}' ||
-                NVL2({cm['fk']}, 'Y', ' ')
-            FROM {MAPPING_TABLE}
+        return _Query(
+            fields=[
+                cm['old_table'],
+                cm['old_column'],
+                cm['new_table_kor'],
+                cm['new_table'],
+                cm['new_column_kor'],
+                cm['new_column'],
+                f"NVL({cm['data_type']}, ' ')",
+                f"NVL(TO_CHAR({cm['length']}), ' ')",
+                f"NVL2({cm['pk']}, 'Y', ' ')",
+                f"NVL2({cm['fk']}, 'Y', ' ')",
+            ],
+            tail=f"""FROM {MAPPING_TABLE}
             WHERE (UPPER({cm['old_table']}), UPPER({cm['old_column']})) IN (
             {in_clause}
-            );
-        """
+            )""",
+            binds=binds
+        )
 
-        rows = self._execute_query(query)
+    def _tables_batch_query(self, table_names: List[str]) -> _Query:
+        """테이블 배치 조회 쿼리 생성"""
+        cm = COLUMN_MAPPING
+        binds = {}
+        in_clause = self._table_in_clause(table_names, binds)
+
+        return _Query(
+            fields=[cm['old_table'], cm['new_table_kor'], cm['new_table']],
+            tail=f"""FROM {MAPPING_TABLE}
+            WHERE UPPER({cm['old_table']}) IN ({in_clause})""",
+            binds=binds,
+            distinct=True
+        )
 
+    @staticmethod
+    def _parse_column_rows(rows: list) -> Dict[Tuple[str, str], ColumnInfo]:
+        """배치 컬럼 조회 결과 → {(upper(old_table), upper(old_column)): ColumnInfo}"""
         result = {}
         for row in rows:
             if len(row) >= 10:
@@ -218,40 +471,9 @@ EXIT;
 
         return result
 
-    def get_tables_batch(self, table_names: List[str]) -> Dict[str, TableInfo]:
-        """여러 테이블을 한번에 조회 (배치 쿼리)
-
-        Args:
-            table_names: [old_table_name, ...] 리스트
-
-        Returns:
-            {upper(old_table_name): TableInfo} 딕셔너리
-        """
-        if not table_names:
-            return {}
-
-        cm = COLUMN_MAPPING
-        d = self.DELIMITER
-
-        # IN 절 생성
-        in_clause_items = []
-        for table_name in table_names:
-            safe_name = table_name.replace("'", "''")
-            in_clause_items.append(f"'{safe_name.upper()}'")
-
-        in_clause = ', '.join(in_clause_items)
-
-        query = f"""
-            SELECT DISTINCT
-                {cm['old_table']} || '{d}' ||
-                {cm['new_table_kor']} || '{d}' ||
-                {cm['new_table']}
-            FROM {MAPPING_TABLE}
-            WHERE UPPER({cm['old_table']}) IN ({in_clause});
-        """
-
-        rows = self._execute_query(query)
-
+    @staticmethod
+    def _parse_table_rows(rows: list) -> Dict[str, TableInfo]:
+        """배치 테이블 조회 결과 → {upper(old_table_name): TableInfo}"""
         result = {}
         for row in rows:
             if len(row) >= 3:
@@ -265,41 +487,72 @@ EXIT;
 
         return result
 
-    def get_all_columns_for_table(self, old_table_name: str) -> List[ColumnInfo]:
-        """특정 테이블의 모든 컬럼 정보 조회 (SELECT * 처리용)
+    def get_columns_batch(self, column_requests: List[Tuple[str, str]]) -> Dict[Tuple[str, str], ColumnInfo]:
+        """여러 (테이블, 컬럼) 쌍을 한번에 조회 (배치 쿼리)
 
         Args:
-            old_table_name: 기존 테이블명
+            column_requests: [(old_table, old_column), ...] 리스트
 
         Returns:
-            해당 테이블의 모든 ColumnInfo 리스트
+            {(upper(old_table), upper(old_column)): ColumnInfo} 딕셔너리
         """
-        cm = COLUMN_MAPPING
-        d = self.DELIMITER
-        safe_name = old_table_name.replace("'", "''")
-
-        query = f"""
-            SELECT
-                {cm['old_column']} || '{d}' ||
-                {cm['new_table_kor']} || '{d}' ||
-                {cm['new_table']} || '{d}' ||
-                {cm['new_column_kor']} || '{d}' ||
-                {cm['new_column']} || '{d}' ||
-                NVL({cm['data_type']}, ' ') || '{d}' ||
-                NVL(TO_CHAR({cm['length']}), ' ') || '{d}' ||
-                NVL2({cm['pk']}, 'Y', ' ') || '{d}' ||
-                NVL2({cm['fk']}, 'Y', ' ')
-            FROM {MAPPING_TABLE}
-            WHERE UPPER({cm['old_table']}) = UPPER('{safe_name}')
-            ORDER BY {cm['new_column']};
+        if not column_requests:
+            return {}
+
+        rows = self._run_batched([(self._columns_batch_query, list(column_requests))])[0]
+        return self._parse_column_rows(rows)
+
+    def get_tables_batch(self, table_names: List[str]) -> Dict[str, TableInfo]:
+        """여러 테이블을 한번에 조회 (배치 쿼리)
+
+        Args:
+            table_names: [old_table_name, ...] 리스트
+
+        Returns:
+            {upper(old_table_name): TableInfo} 딕셔너리
         """
+        if not table_names:
+            return {}
+
+        rows = self._run_batched([(self._tables_batch_query, list(table_names))])[0]
+        return self._parse_table_rows(rows)
 
-        rows = self._execute_query(query)
-        result = []
+    def _all_columns_query(self, table_names: List[str]) -> _Query:
+        """여러 테이블의 전체 컬럼 조회 쿼리 생성 (SELECT * 처리용)"""
+        cm = COLUMN_MAPPING
+        binds = {}
+        in_clause = self._table_in_clause(table_names, binds)
+
+        return _Query(
+            fields=[
+                cm['old_table'],
+                cm['new_table_kor'],
+                cm['new_table'],
+                cm['new_column_kor'],
+                cm['new_column'],
+                f"NVL({cm['data_type']}, ' ')",
+                f"NVL(TO_CHAR({cm['length']}), ' ')",
+                f"NVL2({cm['pk']}, 'Y', ' ')",
+                f"NVL2({cm['fk']}, 'Y', ' ')",
+            ],
+            tail=f"""FROM {MAPPING_TABLE}
+            WHERE UPPER({cm['old_table']}) IN ({in_clause})
+            ORDER BY {cm['new_column']}""",
+            binds=binds
+        )
 
+    @staticmethod
+    def _parse_all_columns_rows(rows: list, table_names: List[str]) -> Dict[str, List[ColumnInfo]]:
+        """전체 컬럼 조회 결과 → {old_table_name(요청한 그대로): [ColumnInfo, ...]}"""
+        grouped = {}
         for row in rows:
             if len(row) >= 9:
-                result.append(ColumnInfo(
+                grouped.setdefault(row[0].strip().upper(), []).append(row)
+
+        result = {}
+        for table_name in table_names:
+            result[table_name] = [
+                ColumnInfo(
                     table_kor=row[1].strip(),
                     table_eng=row[2].strip(),
                     col_kor=row[3].strip(),
@@ -308,12 +561,74 @@ EXIT;
                     length=row[6].strip(),
                     pk=row[7].strip(),
                     fk=row[8].strip(),
-                    old_table_eng=old_table_name,
+                    old_table_eng=table_name,
                     is_mapped=True
-                ))
+                )
+                for row in grouped.get(table_name.upper(), [])
+            ]
 
         return result
 
+    def get_mappings_batch(
+        self,
+        column_requests: List[Tuple[str, str]],
+        table_names: List[str],
+        star_table_names: List[str] = ()
+    ) -> Tuple[Dict[Tuple[str, str], ColumnInfo], Dict[str, TableInfo], Dict[str, List[ColumnInfo]]]:
+        """컬럼/테이블 매핑과 SELECT * 테이블의 전체 컬럼을 한 번에 함께 조회
+
+        Args:
+            column_requests: [(old_table, old_column), ...] 리스트
+            table_names: [old_table_name, ...] 리스트
+            star_table_names: 전체 컬럼이 필요한 [old_table_name, ...] 리스트
+
+        Returns:
+            (get_columns_batch 결과, get_tables_batch 결과, get_all_columns_for_tables 결과)
+
+        Raises:
+            OracleQueryError: 조회 실패 (빈 결과로 돌려주면 매핑 없음과 구분되지 않음)
+        """
+        if not (column_requests or table_names or star_table_names):
+            return {}, {}, {}
+
+        column_rows, table_rows, all_column_rows = self._run_batched([
+            (self._columns_batch_query, list(column_requests)),
+            (self._tables_batch_query, list(table_names)),
+            (self._all_columns_query, list(star_table_names)),
+        ])
+
+        return (
+            self._parse_column_rows(column_rows),
+            self._parse_table_rows(table_rows),
+            self._parse_all_columns_rows(all_column_rows, star_table_names)
+        )
+
+    def get_all_columns_for_tables(self, table_names: List[str]) -> Dict[str, List[ColumnInfo]]:
+        """여러 테이블의 모든 컬럼 정보를 한번에 조회 (SELECT * 처리용)
+
+        Args:
+            table_names: [old_table_name, ...] 리스트
+
+        Returns:
+            {old_table_name: 해당 테이블의 모든 ColumnInfo 리스트} 딕셔너리
+        """
+        if not table_names:
+            return {}
+
+        rows = self._run_batched([(self._all_columns_query, list(table_names))])[0]
+        return self._parse_all_columns_rows(rows, table_names)
+
+    def get_all_columns_for_table(self, old_table_name: str) -> List[ColumnInfo]:
+        """특정 테이블의 모든 컬럼 정보 조회 (SELECT * 처리용)
+
+        Args:
+            old_table_name: 기존 테이블명
+
+        Returns:
+            해당 테이블의 모든 ColumnInfo 리스트
+        """
+        return self.get_all_columns_for_tables([old_table_name])[old_table_name]
+
     def create_unmapped_table_info(self, old_table_name: str) -> TableInfo:
         """매핑되지 않은 테이블 정보 생성"""
         return TableInfo(
@@ -365,7 +680,7 @@ def test_connection():
     """연결 테스트"""
     try:
         with OracleMapper() as mapper:
-            print("SQLcl 기반 Oracle 연결 테스트...")
+            print(f"Oracle 연결 테스트 ({'oracledb' if _load_oracledb() else 'SQLcl'})...")
 
             # 샘플 조회
             info = mapper.get_table_info("NBOGUN_JakupSite")
@@ -4,14 +4,66 @@ SQL Parser 전처리 모듈
 - 테이블, 컬럼, 파라미터 정보를 구조화하여 추출
 """
 
+import os
 import re
+import sys
+import pickle
+import hashlib
+import threading
 import sqlglot
 from sqlglot import exp
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Tuple, Optional
+from itertools import chain
+from pathlib import Path
+from typing import Iterator, List, Dict, Set, Tuple, Optional
 
+# 파싱 결과 캐시 디렉토리 (프로시저 본문 해시 → ParseResult pickle)
+PARSE_CACHE_DIR = Path(__file__).parent.parent / ".parse_cache"
 
-@dataclass
+# 파서 코드/sqlglot 버전이 바뀌면 이전 캐시를 쓰지 않도록 키에 포함
+PARSER_VERSION = f"{hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()}-{sqlglot.__version__}"
+
+# 프로시저명: CREATE PROC[EDURE] [스키마].[이름]
+PROC_NAME_RE = re.compile(r'CREATE\s+PROC(?:EDURE)?\s+\[?(\w+)\]?\.\[?(\w+)\]?', re.IGNORECASE)
+
+# 프로시저 선언부 (AS 이전)
+PROC_HEADER_RE = re.compile(r'(CREATE\s+PROC.*?)\bAS\b', re.IGNORECASE | re.DOTALL)
+
+# 선언부 파라미터: @이름 타입 [= 기본값]
+PARAM_RE = re.compile(r'@(\w+)\s+([\w\(\),\s]+?)(?:\s*=\s*([^\s,\)]+))?(?=\s*,|\s*\)|$)')
+
+# IF @Gubun = 'X' 분기
+BRANCH_SPLIT_RE = re.compile(r"(?:ELSE\s+)?IF\s+(@\w+)\s*=\s*'?(\w+)'?", re.IGNORECASE)
+
+# SELECT 문 경계 키워드 - SELECT 문은 다음 키워드 직전까지 (중첩 고려 안함)
+STATEMENT_KEYWORD_RE = re.compile(r'\b(?:(SELECT)|INSERT|UPDATE|DELETE|IF|ELSE|END)\b', re.IGNORECASE)
+
+# 테이블 힌트: with (nolock), with (readuncommitted) 등
+TABLE_HINT_RE = re.compile(r'\s+with\s*\([^)]+\)', re.IGNORECASE)
+
+# FROM/JOIN 테이블 (정규식 폴백용) - #임시테이블 포함
+FROM_JOIN_RE = re.compile(r'(?:FROM|JOIN)\s+\[?(#?\w+)\]?(?:\s+(?:AS\s+)?([A-Za-z]\w*))?', re.IGNORECASE)
+
+# SELECT 절 (정규식 폴백용)
+SELECT_CLAUSE_RE = re.compile(r'SELECT\s+(.*?)\s+FROM', re.IGNORECASE | re.DOTALL)
+
+# A.Column 또는 A.* 참조 (정규식 폴백용)
+COLUMN_REF_RE = re.compile(r'(\w+)\.(\w+|\*)')
+
+# alias로 잘못 잡히는 SQL 키워드 (대문자/소문자/첫 글자 대문자 표기를 미리 포함하여 upper() 없이 비교)
+KEYWORD_ALIASES = frozenset(
+    form
+    for keyword in ('WHERE', 'WITH', 'ON', 'AND', 'OR', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'CROSS')
+    for form in (keyword, keyword.lower(), keyword.capitalize())
+)
+
+
+def _strip_dbo(name: str) -> str:
+    """테이블명의 dbo. 스키마 접두어 제거 (대소문자 무시)"""
+    return name[4:] if name[:4].lower() == 'dbo.' else name
+
+
+@dataclass(slots=True, frozen=True)
 class ParsedTable:
     """파싱된 테이블 정보"""
     name: str
@@ -19,8 +71,13 @@ class ParsedTable:
     is_temp: bool = False  # 임시테이블 (#으로 시작)
     branch: str = ""  # 소속 분기 (IF @Gubun = '1' 등)
 
+    def __post_init__(self):
+        # 같은 테이블명/분기 문자열이 반복되므로 intern하여 공유 (frozen이므로 object.__setattr__ 사용)
+        for name in ('name', 'alias', 'branch'):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ParsedColumn:
     """파싱된 컬럼 정보"""
     table: str  # 테이블명 또는 별칭
@@ -30,8 +87,13 @@ class ParsedColumn:
     parameter: str = ""      # 연관 파라미터 (@xxx)
     branch: str = ""         # 소속 분기
 
+    def __post_init__(self):
+        # 같은 테이블/컬럼/파라미터/분기 문자열이 반복되므로 intern하여 공유 (frozen이므로 object.__setattr__ 사용)
+        for name in ('table', 'column', 'parameter', 'branch'):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
 
-@dataclass
+@dataclass(slots=True)
 class ParsedBranch:
     """IF/ELSE 분기 정보"""
     condition: str  # 예: "@Gubun = '1'"
@@ -40,7 +102,7 @@ class ParsedBranch:
     where_columns: List[ParsedColumn] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """전체 파싱 결과"""
     procedure_name: str = ""
@@ -50,17 +112,56 @@ class ParseResult:
     all_select_columns: List[ParsedColumn] = field(default_factory=list)
     all_where_columns: List[ParsedColumn] = field(default_factory=list)
     alias_map: Dict[str, str] = field(default_factory=dict)  # 별칭 → 테이블명
+    unique_tables: Dict[str, ParsedTable] = field(default_factory=dict)  # 테이블명 → 처음 나온 테이블
+    unique_where_columns: List[ParsedColumn] = field(default_factory=list)  # (테이블, 컬럼, 파라미터) 중복 제거
 
 
 class SQLParser:
     """MSSQL 프로시저 파서"""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache
         self.alias_map = {}  # 별칭 → 원본 테이블명 매핑
+        self._table_keys: Set[Tuple] = set()   # 추출한 테이블 키 (중복 제거용)
+        self._column_keys: Set[Tuple] = set()  # 추출한 컬럼 키 (중복 제거용)
 
     def parse(self, sql_text: str) -> ParseResult:
+        """프로시저 전체 파싱 (같은 본문은 캐시된 결과 사용)"""
+        if not self.use_cache:
+            return self._parse(sql_text)
+
+        key = hashlib.blake2b(f"{PARSER_VERSION}\0{sql_text}".encode('utf-8'), digest_size=16).hexdigest()
+        cache_file = PARSE_CACHE_DIR / f"{key}.pkl"
+        if cache_file.exists():
+            try:
+                result = pickle.loads(cache_file.read_bytes())
+                self.alias_map.update(result.alias_map)
+                return result
+            except Exception:
+                pass  # 깨진 캐시는 무시하고 다시 파싱
+
+        result = self._parse(sql_text)
+
+        # 임시 파일에 쓴 뒤 교체하여 동시 실행 시에도 깨진 파일이 보이지 않게 함
+        # 저장 실패(읽기 전용 경로, 디스크 부족 등)는 파싱 결과에 영향 없이 캐시만 건너뜀
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"    (파싱 캐시 저장 실패: {e})")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+        return result
+
+    def _parse(self, sql_text: str) -> ParseResult:
         """프로시저 전체 파싱"""
         result = ParseResult()
+        self._table_keys.clear()
+        self._column_keys.clear()
 
         # 1. 프로시저명 추출
         result.procedure_name = self._extract_proc_name(sql_text)
@@ -72,6 +173,7 @@ class SQLParser:
         branches = self._split_branches(sql_text)
 
         # 4. 각 분기별 파싱
+        where_keys = set()
         for branch_condition, branch_sql in branches:
             branch = self._parse_branch(branch_condition, branch_sql)
             result.branches.append(branch)
@@ -81,6 +183,15 @@ class SQLParser:
             result.all_select_columns.extend(branch.select_columns)
             result.all_where_columns.extend(branch.where_columns)
 
+            # 분기 전체 기준 중복 제거 목록 (to_structured_text용)
+            for t in branch.tables:
+                result.unique_tables.setdefault(t.name, t)
+            for col in branch.where_columns:
+                key = (col.table, col.column, col.parameter)
+                if col.parameter and key not in where_keys:
+                    where_keys.add(key)
+                    result.unique_where_columns.append(col)
+
         # 5. 별칭 맵 저장
         result.alias_map = self.alias_map.copy()
 
@@ -88,7 +199,7 @@ class SQLParser:
 
     def _extract_proc_name(self, sql: str) -> str:
         """프로시저명 추출"""
-        match = re.search(r'CREATE\s+PROC(?:EDURE)?\s+\[?(\w+)\]?\.\[?(\w+)\]?', sql, re.IGNORECASE)
+        match = PROC_NAME_RE.search(sql)
         if match:
             return match.group(2)
         return ""
@@ -96,14 +207,11 @@ class SQLParser:
     def _extract_parameters(self, sql: str) -> List[Dict]:
         """파라미터 목록 추출"""
         params = []
-        # 프로시저 선언부에서 파라미터 추출
-        param_pattern = r'@(\w+)\s+([\w\(\),\s]+?)(?:\s*=\s*([^\s,\)]+))?(?=\s*,|\s*\)|$)'
-
-        # AS 이전 부분에서만 검색
-        header_match = re.search(r'(CREATE\s+PROC.*?)\bAS\b', sql, re.IGNORECASE | re.DOTALL)
+        # 프로시저 선언부(AS 이전 부분)에서만 파라미터 검색
+        header_match = PROC_HEADER_RE.search(sql)
         if header_match:
             header = header_match.group(1)
-            for match in re.finditer(param_pattern, header):
+            for match in PARAM_RE.finditer(header):
                 params.append({
                     "name": f"@{match.group(1)}",
                     "type": match.group(2).strip(),
@@ -116,9 +224,7 @@ class SQLParser:
         branches = []
 
         # IF @Gubun = 'X' 패턴으로 분리
-        pattern = r"(?:ELSE\s+)?IF\s+(@\w+)\s*=\s*'?(\w+)'?"
-
-        parts = re.split(pattern, sql, flags=re.IGNORECASE)
+        parts = BRANCH_SPLIT_RE.split(sql)
 
         if len(parts) == 1:
             # 분기 없음 - 전체를 하나의 분기로
@@ -156,16 +262,27 @@ class SQLParser:
             try:
                 parsed = sqlglot.parse_one(select_sql, dialect="tsql")
 
-                # 테이블 추출
-                tables = self._extract_tables_from_ast(parsed, condition)
+                # AST를 한 번만 순회하며 테이블/SELECT/WHERE 노드 수집 (BFS, find_all과 같은 순서)
+                table_nodes, select_nodes, where_nodes = [], [], []
+                for node in parsed.walk():
+                    node_type = type(node)
+                    if node_type is exp.Table:
+                        table_nodes.append(node)
+                    elif node_type is exp.Select:
+                        select_nodes.append(node)
+                    elif node_type is exp.Where:
+                        where_nodes.append(node)
+
+                # 테이블 추출 (별칭 맵 갱신 후 컬럼 추출)
+                tables = self._extract_tables_from_ast(table_nodes, condition)
                 branch.tables.extend(tables)
 
                 # SELECT 컬럼 추출
-                select_cols = self._extract_select_columns_from_ast(parsed, condition)
+                select_cols = self._extract_select_columns_from_ast(select_nodes, condition)
                 branch.select_columns.extend(select_cols)
 
                 # WHERE 컬럼 추출
-                where_cols = self._extract_where_columns_from_ast(parsed, condition)
+                where_cols = self._extract_where_columns_from_ast(where_nodes, condition)
                 branch.where_columns.extend(where_cols)
 
             except Exception as e:
@@ -182,40 +299,56 @@ class SQLParser:
         """SQL에서 SELECT 문 추출"""
         statements = []
 
-        # 간단한 SELECT 문 추출 (중첩 고려 안함)
-        pattern = r'\bSELECT\b.*?(?=\bSELECT\b|\bINSERT\b|\bUPDATE\b|\bDELETE\b|\bIF\b|\bELSE\b|\bEND\b|$)'
+        # 경계 키워드 위치를 한 번에 찾아 SELECT부터 다음 키워드 직전까지 잘라냄 (중첩 고려 안함)
+        keywords = [(m.start(), m.lastindex == 1) for m in STATEMENT_KEYWORD_RE.finditer(sql)]
+        keywords.append((len(sql), False))
 
-        for match in re.finditer(pattern, sql, re.IGNORECASE | re.DOTALL):
-            stmt = match.group(0).strip()
-            if stmt:
-                statements.append(stmt)
+        for (start, is_select), (end, _) in zip(keywords, keywords[1:]):
+            if is_select:
+                stmt = sql[start:end].strip()
+                if stmt:
+                    statements.append(stmt)
 
         return statements if statements else [sql]
 
     def _preprocess_sql(self, sql: str) -> str:
         """SQL 전처리 - MSSQL 힌트 제거 등"""
         # with (nolock), with (readuncommitted) 등 테이블 힌트 제거
-        sql = re.sub(r'\s+with\s*\([^)]+\)', '', sql, flags=re.IGNORECASE)
+        sql = TABLE_HINT_RE.sub('', sql)
         return sql
 
-    def _extract_tables_from_ast(self, ast, branch: str) -> List[ParsedTable]:
-        """AST에서 테이블 추출"""
+    def _add_table(self, tables: List[ParsedTable], table: ParsedTable):
+        """같은 분기에서 처음 나온 (테이블, 별칭)만 추가"""
+        key = (table.name.upper(), table.alias.upper(), table.branch)
+        if key not in self._table_keys:
+            self._table_keys.add(key)
+            tables.append(table)
+
+    def _add_column(self, columns: List[ParsedColumn], column: ParsedColumn):
+        """같은 분기에서 처음 나온 (테이블, 컬럼, WHERE 여부, 파라미터)만 추가"""
+        key = (column.table.upper(), column.column.upper(), column.branch, column.is_where, column.parameter)
+        if key not in self._column_keys:
+            self._column_keys.add(key)
+            columns.append(column)
+
+    def _extract_tables_from_ast(self, table_nodes: List[exp.Table], branch: str) -> List[ParsedTable]:
+        """AST의 Table 노드에서 테이블 추출"""
         tables = []
 
-        for table in ast.find_all(exp.Table):
+        for table in table_nodes:
             name = table.name
             alias = table.alias if table.alias else ""
 
             # dbo. 제거
-            name = re.sub(r'^dbo\.', '', name, flags=re.IGNORECASE)
+            name = _strip_dbo(name)
 
             # SQL 키워드가 alias로 잡힌 경우 제외
-            if alias and alias.upper() in ('WHERE', 'WITH', 'ON', 'AND', 'OR', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'CROSS'):
+            if alias in KEYWORD_ALIASES:
                 alias = ""
 
             is_temp = name.startswith('#')
 
-            tables.append(ParsedTable(
+            self._add_table(tables, ParsedTable(
                 name=name,
                 alias=alias,
                 is_temp=is_temp,
@@ -228,42 +361,38 @@ class SQLParser:
 
         return tables
 
-    def _extract_select_columns_from_ast(self, ast, branch: str) -> List[ParsedColumn]:
-        """AST에서 SELECT 컬럼 추출"""
+    def _extract_select_columns_from_ast(self, select_nodes: List[exp.Select], branch: str) -> List[ParsedColumn]:
+        """AST의 Select 노드에서 SELECT 컬럼 추출"""
         columns = []
 
         # SELECT 절의 컬럼들
-        for select in ast.find_all(exp.Select):
+        for select in select_nodes:
             for expr in select.expressions:
                 cols = self._extract_column_refs(expr, branch, is_select=True)
                 columns.extend(cols)
 
         return columns
 
-    def _extract_where_columns_from_ast(self, ast, branch: str) -> List[ParsedColumn]:
-        """AST에서 WHERE 컬럼 추출"""
+    def _extract_where_columns_from_ast(self, where_nodes: List[exp.Where], branch: str) -> List[ParsedColumn]:
+        """AST의 Where 노드에서 WHERE 컬럼 추출"""
         columns = []
 
-        for where in ast.find_all(exp.Where):
+        for where in where_nodes:
             # 파라미터(@xxx)와 비교되는 컬럼 찾기
             for eq in where.find_all(exp.EQ):
                 left = eq.left
                 right = eq.right
 
-                param = None
-                col_expr = None
-
-                # @파라미터 찾기
-                if isinstance(right, exp.Parameter) or (hasattr(right, 'name') and str(right).startswith('@')):
-                    param = str(right)
-                    col_expr = left
-                elif isinstance(left, exp.Parameter) or (hasattr(left, 'name') and str(left).startswith('@')):
-                    param = str(left)
-                    col_expr = right
+                # @파라미터 찾기 (tsql 방언은 @xxx를 exp.Parameter로 파싱)
+                if isinstance(right, exp.Parameter):
+                    param, col_expr = right, left
+                elif isinstance(left, exp.Parameter):
+                    param, col_expr = left, right
+                else:
+                    continue
 
-                if param and col_expr:
-                    cols = self._extract_column_refs(col_expr, branch, is_where=True, parameter=param)
-                    columns.extend(cols)
+                cols = self._extract_column_refs(col_expr, branch, is_where=True, parameter=str(param))
+                columns.extend(cols)
 
         return columns
 
@@ -271,40 +400,37 @@ class SQLParser:
         """표현식에서 컬럼 참조 추출"""
         columns = []
 
-        if isinstance(expr, exp.Column):
-            table = expr.table if expr.table else ""
-            column = expr.name
-
-            # 별칭을 원본 테이블명으로 변환
-            if table in self.alias_map:
-                table = self.alias_map[table]
-
-            columns.append(ParsedColumn(
-                table=table,
-                column=column,
-                is_select=is_select,
-                is_where=is_where,
-                parameter=parameter,
-                branch=branch
-            ))
-
-        elif isinstance(expr, exp.Star):
-            # SELECT * 또는 A.*
-            table = expr.table if hasattr(expr, 'table') and expr.table else ""
-            if table in self.alias_map:
-                table = self.alias_map[table]
-
-            columns.append(ParsedColumn(
-                table=table,
-                column="*",
-                is_select=is_select,
-                branch=branch
-            ))
-
-        else:
-            # 재귀적으로 하위 표현식 탐색
-            for child in expr.iter_expressions() if hasattr(expr, 'iter_expressions') else []:
-                columns.extend(self._extract_column_refs(child, branch, is_select, is_where, parameter))
+        # 깊이 우선으로 하위 표현식 탐색 (Column/Star 아래로는 내려가지 않음)
+        for node in expr.walk(bfs=False, prune=lambda n: isinstance(n, (exp.Column, exp.Star))):
+            if isinstance(node, exp.Column):
+                table = node.table if node.table else ""
+                column = node.name
+
+                # 별칭을 원본 테이블명으로 변환
+                if table in self.alias_map:
+                    table = self.alias_map[table]
+
+                self._add_column(columns, ParsedColumn(
+                    table=table,
+                    column=column,
+                    is_select=is_select,
+                    is_where=is_where,
+                    parameter=parameter,
+                    branch=branch
+                ))
+
+            elif isinstance(node, exp.Star):
+                # SELECT * 또는 A.*
+                table = node.table if hasattr(node, 'table') and node.table else ""
+                if table in self.alias_map:
+                    table = self.alias_map[table]
+
+                self._add_column(columns, ParsedColumn(
+                    table=table,
+                    column="*",
+                    is_select=is_select,
+                    branch=branch
+                ))
 
         return columns
 
@@ -313,20 +439,18 @@ class SQLParser:
         tables = []
 
         # FROM/JOIN 패턴 - #임시테이블 포함
-        pattern = r'(?:FROM|JOIN)\s+\[?(#?\w+)\]?(?:\s+(?:AS\s+)?([A-Za-z]\w*))?'
-
-        for match in re.finditer(pattern, sql, re.IGNORECASE):
+        for match in FROM_JOIN_RE.finditer(sql):
             name = match.group(1)
             alias = match.group(2) if match.group(2) else ""
 
             # dbo. 제거
-            name = re.sub(r'^dbo\.', '', name, flags=re.IGNORECASE)
+            name = _strip_dbo(name)
 
             # SQL 키워드가 alias로 잡힌 경우 제외
-            if alias and alias.upper() in ('WHERE', 'WITH', 'ON', 'AND', 'OR', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'CROSS'):
+            if alias in KEYWORD_ALIASES:
                 alias = ""
 
-            tables.append(ParsedTable(
+            self._add_table(tables, ParsedTable(
                 name=name,
                 alias=alias,
                 is_temp=name.startswith('#'),
@@ -343,16 +467,14 @@ class SQLParser:
         columns = []
 
         # SELECT 절 추출
-        select_match = re.search(r'SELECT\s+(.*?)\s+FROM', sql, re.IGNORECASE | re.DOTALL)
+        select_match = SELECT_CLAUSE_RE.search(sql)
         if not select_match:
             return columns
 
         select_clause = select_match.group(1)
 
-        # A.Column 또는 Column 패턴
-        pattern = r'(\w+)\.(\w+|\*)'
-
-        for match in re.finditer(pattern, select_clause):
+        # A.Column 또는 A.* 패턴
+        for match in COLUMN_REF_RE.finditer(select_clause):
             table = match.group(1)
             column = match.group(2)
 
@@ -360,7 +482,7 @@ class SQLParser:
             if table in self.alias_map:
                 table = self.alias_map[table]
 
-            columns.append(ParsedColumn(
+            self._add_column(columns, ParsedColumn(
                 table=table,
                 column=column,
                 is_select=True,
@@ -371,71 +493,64 @@ class SQLParser:
 
     def to_structured_text(self, result: ParseResult) -> str:
         """파싱 결과를 구조화된 텍스트로 변환 (LLM 입력용)"""
-        lines = []
-
-        lines.append("## SQL 파서 전처리 결과")
-        lines.append("")
+        return "\n".join(chain(
+            self._render_header(result),
+            self._render_params(result),
+            self._render_tables(result),
+            self._render_branches(result),
+            self._render_where_columns(result),
+        ))
+
+    @staticmethod
+    def _render_header(result: ParseResult) -> Iterator[str]:
+        """제목 + 프로시저명"""
+        yield "## SQL 파서 전처리 결과"
+        yield ""
 
-        # 프로시저명
         if result.procedure_name:
-            lines.append(f"### 프로시저명: {result.procedure_name}")
-            lines.append("")
+            yield f"### 프로시저명: {result.procedure_name}"
+            yield ""
 
-        # 파라미터
+    @staticmethod
+    def _render_params(result: ParseResult) -> Iterator[str]:
+        """파라미터"""
         if result.parameters:
-            lines.append("### 파라미터")
+            yield "### 파라미터"
             for p in result.parameters:
                 default = f" = {p['default']}" if p.get('default') else ""
-                lines.append(f"- {p['name']}: {p['type']}{default}")
-            lines.append("")
-
-        # 테이블 목록 (중복 제거)
-        unique_tables = {}
-        for t in result.all_tables:
-            key = t.name
-            if key not in unique_tables:
-                unique_tables[key] = t
-
-        if unique_tables:
-            lines.append("### 사용 테이블")
-            for name, t in unique_tables.items():
-                temp_mark = " [임시테이블]" if t.is_temp else ""
+                yield f"- {p['name']}: {p['type']}{default}"
+            yield ""
+
+    @staticmethod
+    def _render_tables(result: ParseResult) -> Iterator[str]:
+        """테이블 목록 (파싱 시 중복 제거됨)"""
+        if result.unique_tables:
+            yield "### 사용 테이블"
+            for name, t in result.unique_tables.items():
                 alias_info = f" (별칭: {t.alias})" if t.alias else ""
-                lines.append(f"- {name}{alias_info}{temp_mark}")
-            lines.append("")
+                temp_mark = " [임시테이블]" if t.is_temp else ""
+                yield f"- {name}{alias_info}{temp_mark}"
+            yield ""
 
-        # 분기별 SELECT 컬럼
+    @staticmethod
+    def _render_branches(result: ParseResult) -> Iterator[str]:
+        """분기별 SELECT 컬럼 (분기 내 컬럼은 파싱 시 중복 제거됨)"""
         if result.branches:
-            lines.append("### 분기별 출력 컬럼 (SELECT)")
+            yield "### 분기별 출력 컬럼 (SELECT)"
             for branch in result.branches:
-                if branch.condition:
-                    lines.append(f"\n**[{branch.condition}]**")
-                else:
-                    lines.append("\n**[기본]**")
-
-                seen = set()
+                yield f"\n**[{branch.condition or '기본'}]**"
                 for col in branch.select_columns:
-                    key = (col.table, col.column)
-                    if key not in seen:
-                        seen.add(key)
-                        table = col.table if col.table else "?"
-                        lines.append(f"- {table}.{col.column}")
-            lines.append("")
-
-        # WHERE 조건 컬럼
-        where_cols = [c for c in result.all_where_columns if c.parameter]
-        if where_cols:
-            lines.append("### 입력 컬럼 (WHERE 조건)")
-            seen = set()
-            for col in where_cols:
-                key = (col.table, col.column, col.parameter)
-                if key not in seen:
-                    seen.add(key)
-                    table = col.table if col.table else "?"
-                    lines.append(f"- {table}.{col.column} ← {col.parameter}")
-            lines.append("")
-
-        return "\n".join(lines)
+                    yield f"- {col.table or '?'}.{col.column}"
+            yield ""
+
+    @staticmethod
+    def _render_where_columns(result: ParseResult) -> Iterator[str]:
+        """WHERE 조건 컬럼 (파싱 시 중복 제거됨)"""
+        if result.unique_where_columns:
+            yield "### 입력 컬럼 (WHERE 조건)"
+            for col in result.unique_where_columns:
+                yield f"- {col.table or '?'}.{col.column} ← {col.parameter}"
+            yield ""
 
 
 def test_parser():